@@ -0,0 +1,17 @@
+"""Shared Gemini model instances for the ADK agents."""
+
+from functools import lru_cache
+
+from google.adk.models import Gemini
+
+
+@lru_cache(maxsize=None)
+def shared_llm(model: str) -> Gemini:
+    """
+    Return the process-wide Gemini instance for a model name.
+
+    An agent given a model *name* resolves it to a new Gemini, and so a new
+    genai client and HTTP connection pool, on every LLM call. Sharing one
+    instance keeps connections alive across calls, agents and cycles.
+    """
+    return Gemini(model=model)
@@ -3,6 +3,8 @@
 from google.adk.agents import Agent
 from pydantic import BaseModel, Field
 
+from .llm import shared_llm
+
 
 class SensorAnalysis(BaseModel):
     """Structured output for sensor analysis."""
@@ -15,33 +17,39 @@ class SensorAnalysis(BaseModel):
     confidence: float = Field(description="Confidence score 0.0-1.0")
 
 
-def create_sensor_agent() -> Agent:
-    """Create sensor analysis agent for non-video data."""
-    
-    instruction = """
-    You are a health and safety sensor analysis agent.
-    
-    **CRITICAL THRESHOLDS:**
-    - Heart Rate: <50 or >120 bpm = ALERT
-    - Oxygen: <90% = CRITICAL
-    - Accelerometer: Magnitude >20 m/s² = FALL
-    - Audio: Scream/Glass Breaking = ALERT
-    - Smoke: >100 ppm = FIRE
+SENSOR_INSTRUCTION = """
+You are a health and safety sensor analysis agent.
+
+**CRITICAL THRESHOLDS:**
+- Heart Rate: <50 or >120 bpm = ALERT
+- Oxygen: <90% = CRITICAL
+- Accelerometer: Magnitude >20 m/s² = FALL
+- Audio: Scream/Glass Breaking = ALERT
+- Smoke: >100 ppm = FIRE
+
+Analyze the sensor data and return a JSON response with:
+- threat_level: "none", "low", "medium", "high", or "critical"
+- fall_detected: true/false
+- vital_anomaly: true/false
+- audio_threat: true/false
+- fire_detected: true/false
+- recommendations: list of actions to take
+- confidence: 0.0 to 1.0
+""".strip()
+
+
+def create_sensor_agent(model: str = "gemini-2.5-flash-lite") -> Agent:
+    """
+    Create sensor analysis agent for non-video data.
     
-    Analyze the sensor data and return a JSON response with:
-    - threat_level: "none", "low", "medium", "high", or "critical"
-    - fall_detected: true/false
-    - vital_anomaly: true/false
-    - audio_threat: true/false
-    - fire_detected: true/false
-    - recommendations: list of actions to take
-    - confidence: 0.0 to 1.0
+    Threshold classification over a small JSON payload needs no more than
+    the lite model.
     """
     
     return Agent(
         name="sensor_analysis_agent",
-        model="gemini-2.5-flash",
-        instruction=instruction,
+        model=shared_llm(model),
+        instruction=SENSOR_INSTRUCTION,
         description="Analyzes sensor data for threats",
         output_schema=SensorAnalysis,
         output_key="sensor_analysis"
@@ -3,6 +3,8 @@
 from google.adk.agents import Agent
 from pydantic import BaseModel, Field
 
+from .llm import shared_llm
+
 
 class VisionAnalysis(BaseModel):
     """Structured output for vision analysis."""
@@ -14,35 +16,68 @@ class VisionAnalysis(BaseModel):
     description: str = Field(description="Brief scene description")
 
 
-def create_vision_agent() -> Agent:
+VISION_INSTRUCTION = """
+You are a security vision analysis agent. Analyze camera frames for threats.
+
+**CRITICAL DETECTION PRIORITIES:**
+1. **WEAPONS**: Gun, knife, any weapon-like object → IMMEDIATE CRITICAL ALERT
+2. **UNFAMILIAR FACES**: Unknown person → HIGH if combined with weapon
+3. **SUSPICIOUS BEHAVIOR**: Camera tampering, forced entry, aggressive movements
+4. **PEOPLE COUNT**: Number of visible individuals
+5. **INCAPACITATION**: Person lying motionless, unusual posture
+
+Return JSON with:
+- threat_level: "none", "low", "medium", "high", or "critical"
+- threats_detected: list of specific threats
+- weapon_type: specific weapon or "none"
+- people_count: integer count
+- unfamiliar_face: true/false
+- description: brief scene description
+""".strip()
+
+
+MULTI_CAMERA_VISION_INSTRUCTION = VISION_INSTRUCTION + """
+
+You will receive several frames, each preceded by a "Camera N:" label.
+Analyze every frame independently and return a "cameras" list with one
+entry per frame, including its camera_id."""
+
+
+class CameraVisionAnalysis(VisionAnalysis):
+    """Vision analysis for one camera within a multi-camera request."""
+    camera_id: int = Field(description="Camera the frame came from")
+
+
+class MultiCameraVisionAnalysis(BaseModel):
+    """Structured output for a batch of camera frames."""
+    cameras: list[CameraVisionAnalysis] = Field(description="One analysis per camera frame")
+
+
+def create_vision_agent(model: str = "gemini-2.5-flash") -> Agent:
     """Create vision analysis agent for threat detection."""
     
-    instruction = """
-    You are a security vision analysis agent. Analyze camera frames for threats.
-    
-    **CRITICAL DETECTION PRIORITIES:**
-    1. **WEAPONS**: Gun, knife, any weapon-like object → IMMEDIATE CRITICAL ALERT
-    2. **UNFAMILIAR FACES**: Unknown person → HIGH if combined with weapon
-    3. **SUSPICIOUS BEHAVIOR**: Camera tampering, forced entry, aggressive movements
-    4. **PEOPLE COUNT**: Number of visible individuals
-    5. **INCAPACITATION**: Person lying motionless, unusual posture
-    
-    Return JSON with:
-    - threat_level: "none", "low", "medium", "high", or "critical"
-    - threats_detected: list of specific threats
-    - weapon_type: specific weapon or "none"
-    - people_count: integer count
-    - unfamiliar_face: true/false
-    - description: brief scene description
-    """
-    
     return Agent(
         name="vision_analysis_agent",
-        model="gemini-2.5-flash",
-        instruction=instruction,
+        model=shared_llm(model),
+        instruction=VISION_INSTRUCTION,
         description="Analyzes camera frames for security threats",
         output_schema=VisionAnalysis,
         output_key="vision_analysis",
         disallow_transfer_to_parent=True,
         disallow_transfer_to_peers=True
-    )
\ No newline at end of file
+    )
+
+
+def create_multi_camera_vision_agent(model: str = "gemini-2.5-flash") -> Agent:
+    """Create vision agent that analyzes several camera frames in one request."""
+    
+    return Agent(
+        name="multi_camera_vision_agent",
+        model=shared_llm(model),
+        instruction=MULTI_CAMERA_VISION_INSTRUCTION,
+        description="Analyzes a batch of camera frames for security threats",
+        output_schema=MultiCameraVisionAnalysis,
+        output_key="multi_camera_analysis",
+        disallow_transfer_to_parent=True,
+        disallow_transfer_to_peers=True
+    )
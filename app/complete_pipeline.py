@@ -1,7 +1,6 @@
 """Complete threat detection pipeline with proper agent integration."""
 
 import asyncio
-import json
 import logging
 import os
 from typing import Any
@@ -22,6 +21,7 @@ if "GOOGLE_API_KEY" not in os.environ:
 from app.agents.orchestrator_agent import create_orchestrator_agent
 from app.agents.sensor_agent import create_sensor_agent
 from app.sensors.simulator import SensorSimulator
+from app.utils.serialization import compact_json
 
 logging.basicConfig(
     level=logging.INFO,
@@ -49,7 +49,7 @@ async def analyze_sensors(sensor_data: dict) -> dict[str, Any]:
     
     content = types.Content(
         role="user",
-        parts=[types.Part(text=f"Analyze this sensor data:\n{json.dumps(sensor_data, indent=2)}")]
+        parts=[types.Part(text=f"Analyze this sensor data:\n{compact_json(sensor_data)}")]
     )
     
     # Get the structured output from state
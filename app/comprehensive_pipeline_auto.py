@@ -1,7 +1,6 @@
 """Comprehensive pipeline with automatic temporal storage."""
 
 import asyncio
-import json
 import logging
 import os
 from pathlib import Path
@@ -19,6 +18,7 @@ from google.genai import types
 from app.agents.sensor_agent import create_sensor_agent
 from app.agents.orchestrator_agent import create_orchestrator_agent
 from app.sensors.simulator import SensorSimulator
+from app.utils.serialization import compact_json
 from app.video.full_video_analyzer import analyze_full_video
 
 # Import temporal storage
@@ -82,7 +82,7 @@ class ComprehensiveThreatDetectionPipeline:
         
         content = types.Content(
             role="user",
-            parts=[types.Part(text=f"Analyze this sensor data:\n{json.dumps(sensor_data, indent=2)}")]
+            parts=[types.Part(text=f"Analyze this sensor data:\n{compact_json(sensor_data)}")]
         )
         
         async for event in runner.run_async(
@@ -174,41 +174,40 @@ class ComprehensiveThreatDetectionPipeline:
         This runs automatically during analysis!
         """
         frame_analyses = analysis.get('frame_analyses', [])
-        stored_count = 0
-        failed_count = 0
         
         logger.info(f"📦 Storing {len(frame_analyses)} frame insights for Camera {camera_id}...")
         
-        for frame_analysis in frame_analyses:
-            try:
-                record_id = self.vector_store.upsert_analysis(
-                    camera_id=camera_id,
-                    timestamp=frame_analysis.get('timestamp', 0),
-                    frame_number=frame_analysis.get('frame_number', 0),
-                    analysis=frame_analysis,
-                    video_path=video_path,
-                    session_id=session_id
+        records = [
+            {
+                "camera_id": camera_id,
+                "timestamp": frame_analysis.get('timestamp', 0),
+                "frame_number": frame_analysis.get('frame_number', 0),
+                "analysis": frame_analysis,
+                "video_path": video_path,
+                "session_id": session_id
+            }
+            for frame_analysis in frame_analyses
+        ]
+        
+        try:
+            record_ids = self.vector_store.upsert_many(records)
+        except Exception as e:
+            logger.error(f"  ❌ Failed to store insights for Camera {camera_id}: {e}")
+            logger.warning(f"⚠️  {len(frame_analyses)} frames failed to store")
+            return
+        
+        # Log only significant events to avoid spam
+        for frame_analysis, record_id in zip(frame_analyses, record_ids):
+            if frame_analysis.get('threat_level') not in ['none', 'low']:
+                logger.info(
+                    f"  📌 Stored {frame_analysis.get('threat_level').upper()} threat "
+                    f"at {frame_analysis.get('timestamp', 0):.1f}s: {record_id}"
                 )
-                stored_count += 1
-                
-                # Log only significant events to avoid spam
-                if frame_analysis.get('threat_level') not in ['none', 'low']:
-                    logger.info(
-                        f"  📌 Stored {frame_analysis.get('threat_level').upper()} threat "
-                        f"at {frame_analysis.get('timestamp', 0):.1f}s: {record_id}"
-                    )
-                
-            except Exception as e:
-                failed_count += 1
-                logger.error(f"  ❌ Failed to store frame {frame_analysis.get('frame_number')}: {e}")
         
         logger.info(
             f"✅ Camera {camera_id} storage complete: "
-            f"{stored_count}/{len(frame_analyses)} frames stored"
+            f"{len(record_ids)}/{len(frame_analyses)} frames stored"
         )
-        
-        if failed_count > 0:
-            logger.warning(f"⚠️  {failed_count} frames failed to store")
     
     async def orchestrate_final_decision(
         self,
@@ -1,7 +1,6 @@
 """Comprehensive pipeline analyzing all 5 cameras + sensors together."""
 
 import asyncio
-import json
 import logging
 import os
 from pathlib import Path
@@ -18,6 +17,7 @@ from google.genai import types
 from app.agents.sensor_agent import create_sensor_agent
 from app.agents.orchestrator_agent import create_orchestrator_agent
 from app.sensors.simulator import SensorSimulator
+from app.utils.serialization import compact_json
 from app.video.full_video_analyzer import analyze_full_video
 
 logging.basicConfig(
@@ -54,7 +54,7 @@ class ComprehensiveThreatDetectionPipeline:
         
         content = types.Content(
             role="user",
-            parts=[types.Part(text=f"Analyze this sensor data:\n{json.dumps(sensor_data, indent=2)}")]
+            parts=[types.Part(text=f"Analyze this sensor data:\n{compact_json(sensor_data)}")]
         )
         
         async for event in runner.run_async(
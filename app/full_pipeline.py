@@ -1,7 +1,6 @@
 """Complete threat detection pipeline with video and sensor analysis."""
 
 import asyncio
-import json
 import logging
 import os
 from typing import Any
@@ -22,6 +21,7 @@ if "GOOGLE_API_KEY" not in os.environ:
 from app.agents.orchestrator_agent import create_orchestrator_agent
 from app.agents.sensor_agent import create_sensor_agent
 from app.sensors.simulator import SensorSimulator
+from app.utils.serialization import compact_json
 from app.video.enhanced_frame_extractor import EnhancedCameraFrameExtractor
 from app.video.vision_analyzer import analyze_frame
 
@@ -51,7 +51,7 @@ async def analyze_sensors(sensor_data: dict) -> dict[str, Any]:
     
     content = types.Content(
         role="user",
-        parts=[types.Part(text=f"Analyze this sensor data:\n{json.dumps(sensor_data, indent=2)}")]
+        parts=[types.Part(text=f"Analyze this sensor data:\n{compact_json(sensor_data)}")]
     )
     
     async for event in runner.run_async(
@@ -84,7 +84,7 @@ async def analyze_cameras(scenario: str, num_cameras: int = 5) -> list[dict[str,
                 logger.info(f"Analyzing Camera {camera_id}...")
                 analysis = await analyze_frame(
                     camera_id=camera_id,
-                    image_base64=frame.image_base64,
+                    image_bytes=frame.image_bytes,
                     scenario=scenario
                 )
                 camera_analyses.append(analysis)
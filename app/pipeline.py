@@ -1,18 +1,254 @@
 """Main processing pipeline for threat detection."""
 
 import asyncio
+import copy
 import logging
-from typing import Dict, List, Any
-from pathlib import Path
+import time
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional
 
-from .video.frame_extractor import CameraFrameExtractor
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from .video.real_video_processor import RealVideoProcessor
 from .sensors.simulator import SensorSimulator
-from .agents.vision_agent import create_vision_agent, analyze_frame
-from .agents.sensor_agent import create_sensor_agent, analyze_sensors
-from .agents.orchestrator import create_orchestrator_agent, assess_threat
+from .sensors.models import CameraFrame
+from .sensors.triage import GRAY_ZONE, MEDIUM, NONE, triage_sensor_data
+from .agents.vision_agent import create_vision_agent, create_multi_camera_vision_agent
+from .agents.sensor_agent import create_sensor_agent
+from .agents.orchestrator_agent import create_orchestrator_agent
+from .utils.serialization import compact_json
 
 logger = logging.getLogger(__name__)
 
+APP_NAME = "threat_detection"
+LITE_MODEL = "gemini-2.5-flash-lite"
+CYCLE_SECONDS = 5
+
+# Sensor agent results for recently seen (quantized) readings
+SENSOR_CACHE_SIZE = 256
+SENSOR_CACHE_TTL = 60.0
+_sensor_cache: "OrderedDict[tuple, tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+ALL_CLEAR_SENSOR_ANALYSIS = {
+    "threat_level": "none",
+    "fall_detected": False,
+    "vital_anomaly": False,
+    "audio_threat": False,
+    "fire_detected": False,
+    "recommendations": [],
+    "confidence": 1.0
+}
+
+ALL_CLEAR_DECISION = {
+    "threat_level": "none",
+    "action_required": "none",
+    "call_911": False,
+    "reasoning": "All sensor readings are within normal ranges and no camera reported a threat.",
+    "evidence": [],
+    "message_to_user": "All clear."
+}
+
+
+async def _run_agent(
+    runner: Runner,
+    session_id: str,
+    content: types.Content,
+    output_key: str
+) -> Dict[str, Any]:
+    """
+    Run an agent on an existing session and return its output_key value.
+    
+    The session is emptied afterwards: agents run with include_contents
+    "none", so its events (including inline JPEGs) are never read again
+    and would otherwise accumulate for as long as the pipeline runs.
+    """
+    # The final response event carries the output in its state delta, so
+    # the session (and its whole event history) never needs to be re-read
+    output = {}
+    try:
+        async for event in runner.run_async(
+            user_id="system",
+            session_id=session_id,
+            new_message=content
+        ):
+            output = event.actions.state_delta.get(output_key, output)
+    finally:
+        await _reset_session(runner, session_id)
+    
+    return output
+
+
+async def _reset_session(runner: Runner, session_id: str):
+    """Replace a session with an empty one under the same ID."""
+    await runner.session_service.delete_session(
+        app_name=runner.app_name, user_id="system", session_id=session_id
+    )
+    await runner.session_service.create_session(
+        app_name=runner.app_name, user_id="system", session_id=session_id
+    )
+
+
+async def analyze_frame(
+    runner: Runner,
+    session_id: str,
+    image_bytes: bytes,
+    camera_id: int,
+    scenario: str = "normal"
+) -> Dict[str, Any]:
+    """Analyze one camera frame with the vision agent."""
+    content = types.Content(
+        role="user",
+        parts=[
+            types.Part(text=f"Analyze this frame from Camera {camera_id}. Context: {scenario} scenario."),
+            types.Part(inline_data=types.Blob(mime_type="image/jpeg", data=image_bytes))
+        ]
+    )
+    analysis = await _run_agent(runner, session_id, content, "vision_analysis")
+    analysis["camera_id"] = camera_id
+    return analysis
+
+
+async def analyze_frames_batch(
+    runner: Runner,
+    session_id: str,
+    frames: List[tuple[int, bytes]],
+    scenario: str = "normal"
+) -> Dict[int, Dict[str, Any]]:
+    """Analyze several camera frames in one multimodal request, keyed by camera."""
+    parts = [types.Part(
+        text=f"Analyze the following {len(frames)} camera frames. Context: {scenario} scenario."
+    )]
+    for camera_id, image_bytes in frames:
+        parts.append(types.Part(text=f"Camera {camera_id}:"))
+        parts.append(types.Part(inline_data=types.Blob(mime_type="image/jpeg", data=image_bytes)))
+    
+    result = await _run_agent(
+        runner,
+        session_id,
+        types.Content(role="user", parts=parts),
+        "multi_camera_analysis"
+    )
+    return {analysis["camera_id"]: analysis for analysis in result.get("cameras", [])}
+
+
+def _sensor_cache_key(sensor_data: Dict[str, Any]) -> tuple:
+    """Bucket sensor readings so near-identical batches share a cache entry."""
+    heart_rate = sensor_data["heart_rate"]
+    smoke = sensor_data["smoke_detector"]
+    return (
+        round(heart_rate["heart_rate"] / 5) * 5,
+        round(heart_rate["oxygen_saturation"]),
+        round(smoke["smoke_level_ppm"] / 10) * 10,
+        smoke["alarm_triggered"],
+        sensor_data["audio"]["event_classification"],
+        round(sensor_data["accelerometer"]["magnitude"]),
+    )
+
+
+async def analyze_sensors(
+    runner: Runner,
+    session_id: str,
+    sensor_data: Dict[str, Any],
+    triage_level: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Analyze a batch of sensor readings with the sensor agent.
+    
+    Results for non-alarming readings are cached for SENSOR_CACHE_TTL
+    seconds, keyed on bucketed values. Pass triage_level when the batch
+    has already been triaged.
+    """
+    if triage_level is None:
+        triage_level = triage_sensor_data(sensor_data)
+    
+    # Never cache batches that cross one of the agent's alert thresholds
+    cacheable = triage_level < MEDIUM
+    if cacheable:
+        key = _sensor_cache_key(sensor_data)
+        entry = _sensor_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < SENSOR_CACHE_TTL:
+            _sensor_cache.move_to_end(key)
+            return copy.deepcopy(entry[1])
+    
+    content = types.Content(
+        role="user",
+        parts=[types.Part(text=f"Analyze this sensor data:\n{compact_json(sensor_data)}")]
+    )
+    analysis = await _run_agent(runner, session_id, content, "sensor_analysis")
+    
+    if cacheable and analysis.get("threat_level") in ("none", "low"):
+        _sensor_cache[key] = (time.monotonic(), copy.deepcopy(analysis))
+        _sensor_cache.move_to_end(key)
+        if len(_sensor_cache) > SENSOR_CACHE_SIZE:
+            _sensor_cache.popitem(last=False)
+    
+    return analysis
+
+
+async def assess_threat(
+    runner: Runner,
+    session_id: str,
+    camera_analyses: List[Dict[str, Any]],
+    sensor_analysis: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Make the final threat decision with the orchestrator agent."""
+    content = types.Content(
+        role="user",
+        parts=[types.Part(text=(
+            f"**CAMERA ANALYSIS**:\n{compact_json(camera_analyses)}\n\n"
+            f"**SENSOR ANALYSIS**:\n{compact_json(sensor_analysis)}\n\n"
+            "Make your final threat assessment based on ALL data."
+        ))]
+    )
+    return await _run_agent(runner, session_id, content, "threat_decision")
+
+
+def quick_triage(
+    sensor_data: Dict[str, Any],
+    triage_level: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Decide unambiguous sensor batches without the sensor agent.
+    
+    Returns an all-clear sensor analysis when every reading is clearly
+    normal, or None when the batch needs LLM analysis. Pass triage_level
+    when the batch has already been triaged.
+    """
+    if triage_level is None:
+        triage_level = triage_sensor_data(sensor_data)
+    if triage_level == NONE:
+        return copy.deepcopy(ALL_CLEAR_SENSOR_ANALYSIS)
+    return None
+
+
+def cameras_clear(camera_analyses: List[Dict[str, Any]]) -> bool:
+    """True when every camera reported no threat and none failed."""
+    return all(
+        not analysis.get("error") and analysis.get("threat_level") == "none"
+        for analysis in camera_analyses
+    )
+
+
+def is_low_stakes(
+    camera_analyses: List[Dict[str, Any]],
+    sensor_analysis: Dict[str, Any],
+    triage_level: int
+) -> bool:
+    """
+    Decide whether the threat decision can go to the lite orchestrator.
+    
+    Only when every signal is benign: cameras clear, sensor readings at
+    most gray-zone, and the sensor agent itself rating them none or low.
+    """
+    return (
+        cameras_clear(camera_analyses)
+        and triage_level <= GRAY_ZONE
+        and not sensor_analysis.get("error")
+        and sensor_analysis.get("threat_level") in ("none", "low")
+    )
+
 
 class ThreatDetectionPipeline:
     """Main pipeline for threat detection system."""
@@ -20,63 +256,222 @@ class ThreatDetectionPipeline:
     def __init__(
         self,
         video_paths: Dict[int, str],
-        scenario: str = "normal"
+        scenario: str = "normal",
+        batch_cameras: bool = True
     ):
         self.video_paths = video_paths
         self.scenario = scenario
+        # Send all camera frames in a single vision request per cycle
+        self.batch_cameras = batch_cameras
         
-        # Initialize agents
-        self.vision_agent = create_vision_agent()
-        self.sensor_agent = create_sensor_agent()
-        self.orchestrator_agent = create_orchestrator_agent()
+        # One session service and one runner per agent, reused every cycle.
+        # Agents see only the current turn, and each session is emptied
+        # after every run so no history accumulates.
+        self.session_service = InMemorySessionService()
+        self.vision_runner = self._make_runner(
+            create_multi_camera_vision_agent() if batch_cameras else create_vision_agent()
+        )
+        self.sensor_runner = self._make_runner(create_sensor_agent())
+        self.orchestrator_runner = self._make_runner(create_orchestrator_agent())
+        # Low-stakes decisions (gray-zone sensors, quiet cameras) go to the
+        # lite model
+        self.orchestrator_lite_runner = self._make_runner(
+            create_orchestrator_agent(model=LITE_MODEL)
+        )
+        self._started = False
+        
+        # Video sources stay open across cycles instead of being reopened
+        # (and re-probed) for every frame
+        self._processors: Dict[int, RealVideoProcessor] = {}
         
         # Initialize sensor simulator
         self.sensor_sim = SensorSimulator(scenario=scenario)
         
         logger.info(f"Pipeline initialized for scenario: {scenario}")
     
+    def _make_runner(self, agent) -> Runner:
+        """Build a runner for an agent that ignores prior session history."""
+        agent.include_contents = "none"
+        return Runner(
+            agent=agent,
+            app_name=APP_NAME,
+            session_service=self.session_service
+        )
+    
+    async def start(self):
+        """Create the camera, sensor and orchestrator sessions once."""
+        if self._started:
+            return
+        
+        if self.batch_cameras:
+            session_ids = ["camera_batch"]
+        else:
+            session_ids = [f"camera_{camera_id}" for camera_id in self.video_paths]
+        session_ids += ["sensor_analysis", "threat_assessment"]
+        for session_id in session_ids:
+            await self.session_service.create_session(
+                app_name=APP_NAME,
+                user_id="system",
+                session_id=session_id
+            )
+        self._started = True
+    
+    async def warmup(self):
+        """
+        Pay one-time costs before the first timed cycle.
+        
+        Compiles the triage kernel, creates the agent sessions, and makes
+        one call per model to open its connection: the sensor agent on a
+        canned normal batch (flash-lite), and the orchestrator on an
+        all-clear input (flash, whose client the vision agent shares via
+        shared_llm).
+        """
+        sensor_data = SensorSimulator(scenario="normal").generate_batch()
+        triage_sensor_data(sensor_data)
+        
+        await self.start()
+        await asyncio.gather(
+            analyze_sensors(self.sensor_runner, "sensor_analysis", sensor_data),
+            assess_threat(
+                self.orchestrator_runner,
+                "threat_assessment",
+                [],
+                copy.deepcopy(ALL_CLEAR_SENSOR_ANALYSIS)
+            )
+        )
+        logger.info("Pipeline warmed up")
+    
+    def _grab_frame(self, camera_id: int) -> CameraFrame:
+        """Decode the first frame of a camera's video (runs in a worker thread)."""
+        processor = self._processors.get(camera_id)
+        if processor is None:
+            processor = RealVideoProcessor(self.video_paths[camera_id], camera_id)
+            self._processors[camera_id] = processor
+        return processor.extract_single_frame(frame_number=0)
+    
+    def close(self):
+        """Release the open video sources."""
+        for processor in self._processors.values():
+            processor.release()
+        self._processors.clear()
+    
+    async def _analyze_camera(self, camera_id: int) -> Dict[str, Any]:
+        """Extract a camera's frame off the event loop and analyze it."""
+        frame = await asyncio.to_thread(self._grab_frame, camera_id)
+        analysis = await analyze_frame(
+            self.vision_runner,
+            f"camera_{camera_id}",
+            frame.image_bytes,
+            camera_id,
+            self.scenario
+        )
+        logger.info(f"Processed Camera {camera_id}")
+        return analysis
+    
+    async def _analyze_cameras_batch(self) -> List[Any]:
+        """
+        Extract every camera's frame and analyze them in one vision request.
+        
+        Returns one analysis or exception per camera, in video_paths order.
+        """
+        frames = await asyncio.gather(
+            *(
+                asyncio.to_thread(self._grab_frame, camera_id)
+                for camera_id in self.video_paths
+            ),
+            return_exceptions=True
+        )
+        
+        batch = [
+            (camera_id, frame.image_bytes)
+            for camera_id, frame in zip(self.video_paths, frames)
+            if not isinstance(frame, Exception)
+        ]
+        analyses = {}
+        batch_error = None
+        if batch:
+            # A failed request (rate limit, timeout, bad output) takes the
+            # batched cameras offline for this cycle but must not abort it,
+            # so sensor analysis and the threat decision still run
+            try:
+                analyses = await analyze_frames_batch(
+                    self.vision_runner, "camera_batch", batch, self.scenario
+                )
+                logger.info(f"Processed {len(batch)} cameras in one request")
+            except Exception as e:
+                logger.error(f"Batch vision request failed: {e}")
+                batch_error = e
+        
+        results = []
+        for camera_id, frame in zip(self.video_paths, frames):
+            if isinstance(frame, Exception):
+                results.append(frame)
+            elif batch_error is not None:
+                results.append(batch_error)
+            elif camera_id in analyses:
+                results.append(analyses[camera_id])
+            else:
+                results.append(ValueError("No analysis returned for camera"))
+        return results
+    
     async def process_cycle(self) -> Dict[str, Any]:
         """Process one cycle (5 seconds) of all sensors."""
+        await self.start()
+        sensor_data = self.sensor_sim.generate_batch()
+        triage_level = triage_sensor_data(sensor_data)
+        
+        # 1. Cameras and sensors are independent, so all agent calls run
+        # concurrently
+        if self.batch_cameras:
+            camera_stage = self._analyze_cameras_batch()
+        else:
+            camera_stage = asyncio.gather(
+                *(
+                    self._analyze_camera(camera_id)
+                    for camera_id in self.video_paths
+                ),
+                return_exceptions=True
+            )
+        triaged = quick_triage(sensor_data, triage_level)
+        if triaged is None:
+            camera_results, sensor_analysis = await asyncio.gather(
+                camera_stage,
+                analyze_sensors(
+                    self.sensor_runner, "sensor_analysis", sensor_data, triage_level
+                )
+            )
+            logger.info("Processed sensor data")
+        else:
+            camera_results, sensor_analysis = await camera_stage, triaged
+            logger.info("Sensor readings normal; skipped sensor agent")
         
-        # 1. Extract frames from all cameras
         camera_analyses = []
-        for camera_id, video_path in self.video_paths.items():
-            try:
-                with CameraFrameExtractor(video_path, camera_id) as extractor:
-                    # Get first frame
-                    frame = next(extractor.extract_frames())
-                    
-                    # Analyze frame
-                    analysis = analyze_frame(
-                        self.vision_agent,
-                        frame.image_base64,
-                        camera_id
-                    )
-                    camera_analyses.append(analysis)
-                    logger.info(f"Processed Camera {camera_id}")
-            except Exception as e:
-                logger.error(f"Camera {camera_id} error: {e}")
-                camera_analyses.append({
+        for camera_id, result in zip(self.video_paths, camera_results):
+            if isinstance(result, Exception):
+                logger.error(f"Camera {camera_id} error: {result}")
+                result = {
                     "camera_id": camera_id,
-                    "error": str(e),
+                    "error": str(result),
                     "status": "offline"
-                })
+                }
+            camera_analyses.append(result)
         
-        # 2. Generate and analyze sensor data
-        sensor_data = self.sensor_sim.generate_batch()
-        sensor_analysis = analyze_sensors(self.sensor_agent, sensor_data)
-        logger.info("Processed sensor data")
-        
-        # 3. Orchestrator makes final decision
-        threat_decision = assess_threat(
-            self.orchestrator_agent,
-            camera_analyses,
-            sensor_analysis
-        )
-        logger.info("Threat assessment complete")
+        # 2. Orchestrator makes final decision, unless nothing needs judging
+        if triaged is not None and cameras_clear(camera_analyses):
+            threat_decision = copy.deepcopy(ALL_CLEAR_DECISION)
+            logger.info("All clear; skipped orchestrator")
+        else:
+            low_stakes = is_low_stakes(camera_analyses, sensor_analysis, triage_level)
+            threat_decision = await assess_threat(
+                self.orchestrator_lite_runner if low_stakes else self.orchestrator_runner,
+                "threat_assessment",
+                camera_analyses,
+                sensor_analysis
+            )
+            logger.info("Threat assessment complete")
         
         return {
-            "timestamp": asyncio.get_event_loop().time(),
+            "timestamp": asyncio.get_running_loop().time(),
             "camera_analyses": camera_analyses,
             "sensor_analysis": sensor_analysis,
             "threat_decision": threat_decision,
@@ -85,17 +480,27 @@ class ThreatDetectionPipeline:
     
     async def run_continuous(self, duration_seconds: int = 60):
         """Run pipeline continuously for specified duration."""
-        cycles = duration_seconds // 5
+        cycles = duration_seconds // CYCLE_SECONDS
         results = []
+        loop = asyncio.get_running_loop()
         
-        for i in range(cycles):
-            logger.info(f"Cycle {i+1}/{cycles}")
-            result = await self.process_cycle()
-            results.append(result)
-            
-            # Wait 5 seconds before next cycle
-            if i < cycles - 1:
-                await asyncio.sleep(5)
+        try:
+            for i in range(cycles):
+                logger.info(f"Cycle {i+1}/{cycles}")
+                start = loop.time()
+                result = await self.process_cycle()
+                results.append(result)
+                
+                # Start the next cycle CYCLE_SECONDS after this one started
+                elapsed = loop.time() - start
+                if elapsed > CYCLE_SECONDS:
+                    logger.warning(
+                        f"Cycle {i+1} overran: {elapsed:.2f}s > {CYCLE_SECONDS}s"
+                    )
+                elif i < cycles - 1:
+                    await asyncio.sleep(CYCLE_SECONDS - elapsed)
+        finally:
+            self.close()
         
         return results
 
@@ -121,6 +526,7 @@ async def run_demo():
         logger.info(f"{'='*60}\n")
         
         pipeline = ThreatDetectionPipeline(video_paths, scenario)
+        await pipeline.warmup()
         results = await pipeline.run_continuous(duration_seconds=15)
         
         # Log final results
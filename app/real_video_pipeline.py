@@ -19,6 +19,7 @@ if "GOOGLE_API_KEY" not in os.environ:
 
 from app.agents.orchestrator_agent import create_orchestrator_agent
 from app.agents.sensor_agent import create_sensor_agent
+from app.sensors.models import CameraFrame
 from app.sensors.simulator import SensorSimulator
 from app.video.real_video_processor import RealVideoProcessor
 from app.video.vision_analyzer import analyze_frame
@@ -31,6 +32,12 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _read_first_frame(video_path: str, camera_id: int) -> CameraFrame:
+    """Open a video and extract its first frame (blocking; run in a thread)."""
+    with RealVideoProcessor(video_path, camera_id) as processor:
+        return processor.extract_single_frame(frame_number=0)
+
+
 class RealVideoPipeline:
     """Threat detection pipeline using real video files."""
     
@@ -62,41 +69,48 @@ class RealVideoPipeline:
         Returns:
             List of camera analysis results
         """
-        camera_analyses = []
-        
-        for camera_id, video_path in video_files.items():
-            try:
-                logger.info(f"Processing Camera {camera_id}: {video_path}")
+        # Each camera decodes on its own worker thread (OpenCV releases the
+        # GIL while decoding) and its vision call overlaps the others
+        return list(await asyncio.gather(*(
+            self._analyze_video_camera(camera_id, video_path, scenario)
+            for camera_id, video_path in video_files.items()
+        )))
+    
+    async def _analyze_video_camera(
+        self,
+        camera_id: int,
+        video_path: str,
+        scenario: str
+    ) -> dict[str, Any]:
+        """Analyze the first frame of one camera's video."""
+        try:
+            logger.info(f"Processing Camera {camera_id}: {video_path}")
+            
+            # Open, probe, decode and JPEG-encode off the event loop
+            frame = await asyncio.to_thread(_read_first_frame, video_path, camera_id)
+            
+            # Analyze frame with vision agent
+            logger.info(f"Analyzing frame from Camera {camera_id}...")
+            return await analyze_frame(
+                camera_id=camera_id,
+                image_bytes=frame.image_bytes,
+                scenario=scenario
+            )
                 
-                with RealVideoProcessor(video_path, camera_id) as processor:
-                    # Extract first frame for analysis
-                    frame = processor.extract_single_frame(frame_number=0)
-                    
-                    # Analyze frame with vision agent
-                    logger.info(f"Analyzing frame from Camera {camera_id}...")
-                    analysis = await analyze_frame(
-                        camera_id=camera_id,
-                        image_base64=frame.image_base64,
-                        scenario=scenario
-                    )
-                    camera_analyses.append(analysis)
-                    
-            except FileNotFoundError as e:
-                logger.error(f"Camera {camera_id} video not found: {e}")
-                camera_analyses.append({
-                    "camera_id": camera_id,
-                    "error": f"Video file not found: {video_path}",
-                    "status": "offline"
-                })
-            except Exception as e:
-                logger.error(f"Camera {camera_id} error: {e}")
-                camera_analyses.append({
-                    "camera_id": camera_id,
-                    "error": str(e),
-                    "status": "error"
-                })
-        
-        return camera_analyses
+        except FileNotFoundError as e:
+            logger.error(f"Camera {camera_id} video not found: {e}")
+            return {
+                "camera_id": camera_id,
+                "error": f"Video file not found: {video_path}",
+                "status": "offline"
+            }
+        except Exception as e:
+            logger.error(f"Camera {camera_id} error: {e}")
+            return {
+                "camera_id": camera_id,
+                "error": str(e),
+                "status": "error"
+            }
     
     async def process_scenario(
         self,
@@ -0,0 +1,42 @@
+"""
+Numba kernels for high-rate sensor simulation.
+
+Also the single home of the optional numba import: without numba, njit
+is a no-op decorator, so kernels run as plain Python.
+"""
+
+import math
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional (the "jit" extra)
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        return lambda func: func
+    
+    prange = range
+
+
+@njit(parallel=True, cache=True)
+def scale_accelerometer_batch(xyz, lows, highs, magnitude):
+    """
+    Map uniform [0, 1) draws onto accelerometer ranges in one parallel pass.
+    
+    Args:
+        xyz: (n, 3) uniform draws, rescaled in place to [lows, highs)
+        lows: Per-axis lower bounds, shape (3,)
+        highs: Per-axis upper bounds, shape (3,)
+        magnitude: (n,) output array for each row's norm
+    """
+    x_lo, y_lo, z_lo = lows[0], lows[1], lows[2]
+    x_span, y_span, z_span = highs[0] - x_lo, highs[1] - y_lo, highs[2] - z_lo
+    for i in prange(xyz.shape[0]):
+        x = x_lo + x_span * xyz[i, 0]
+        y = y_lo + y_span * xyz[i, 1]
+        z = z_lo + z_span * xyz[i, 2]
+        xyz[i, 0] = x
+        xyz[i, 1] = y
+        xyz[i, 2] = z
+        magnitude[i] = math.sqrt(x * x + y * y + z * z)
@@ -1,8 +1,14 @@
 """Sensor data models for home threat detection."""
 
-from typing import Literal
+import binascii
+from functools import cached_property
+from typing import Literal, Optional
 from pydantic import BaseModel, Field
 
+# Threat levels in ascending severity, with a label -> rank lookup
+THREAT_ORDER = ("none", "low", "medium", "high", "critical")
+THREAT_RANK = {level: rank for rank, level in enumerate(THREAT_ORDER)}
+
 
 class AccelerometerData(BaseModel):
     """Accelerometer/IMU data from wearables."""
@@ -50,9 +56,20 @@ class SmokeDetectorData(BaseModel):
 
 
 class CameraFrame(BaseModel):
-    """Camera frame data."""
+    """
+    Camera frame data.
+    
+    Extractors build frames with model_construct(), since they produce
+    valid fields by construction; validation applies elsewhere.
+    """
     camera_id: int
     timestamp: float
     frame_number: int
-    image_base64: str
-    mime_type: str = "image/jpeg"
\ No newline at end of file
+    image_bytes: bytes  # Encoded image, e.g. JPEG
+    mime_type: str = "image/jpeg"
+    dhash: Optional[int] = None  # 64-bit perceptual difference hash
+    
+    @cached_property
+    def image_base64(self) -> str:
+        """Base64 form of the image for text-only transports, encoded on first access."""
+        return binascii.b2a_base64(self.image_bytes, newline=False).decode('ascii')
\ No newline at end of file
@@ -1,141 +1,252 @@
 ﻿"""Sensor data simulators for threat scenarios."""
 
-import random
 import time
-from typing import Literal, Any
+from math import hypot
+from typing import Literal, Any, Optional
+
+import numpy as np
+
 from .models import (
     AccelerometerData, HeartRateData, AudioData, SmokeDetectorData
 )
+from .fast_kernels import NUMBA_AVAILABLE, scale_accelerometer_batch
+from .triage import FALL_MAGNITUDE
+from ..utils.serialization import compact_json_bytes
+
+ACCELEROMETER_ID = "wearable_001"
+HEART_RATE_ID = "smartwatch_001"
+AUDIO_ID = "mic_001"
+SMOKE_DETECTOR_ID = "smoke_001"
+
+# Uniform draws generated per NumPy call
+RANDOM_BLOCK_SIZE = 1024
+
+# Per-scenario (x, y, z) sampling ranges in m/s² and the reported event type
+ACCELEROMETER_PROFILES = {
+    "fall": (((-2, 2), (-2, 2), (-25, -15)), "fall"),
+    "intrusion": (((-15, 15), (-15, 15), (-15, 15)), "violent_shake"),
+    "normal": (((-1.5, 1.5), (-1.5, 1.5), (9.5, 10.5)), "normal"),
+}
+
+# Per-scenario vital-sign ranges (ints are drawn inclusive)
+HEART_RATE_PROFILES = {
+    "fall": {"hr": (45, 60), "spo2": (85, 92), "sys": (85, 100), "dia": (50, 65), "anomaly": True},
+    "intrusion": {"hr": (120, 150), "spo2": (94, 98), "sys": (140, 170), "dia": (90, 105), "anomaly": True},
+    "normal": {"hr": (60, 80), "spo2": (96, 99), "sys": (110, 130), "dia": (70, 85), "anomaly": False},
+}
+
+# Per-scenario candidate audio events as (classification, dB range, Hz
+# range), plus the classifier confidence range
+AUDIO_PROFILES = {
+    "intrusion": (
+        (
+            ("scream", (85, 105), (800, 1200)),
+            ("glass_breaking", (90, 110), (2000, 4000)),
+            ("door_slam", (85, 95), (100, 300)),
+        ),
+        (0.75, 0.95),
+    ),
+    "fire": ((("alarm", (95, 110), (2000, 3500)),), (0.85, 0.98)),
+    "normal": (
+        (
+            ("silence", (15, 30), (200, 500)),
+            ("normal_speech", (30, 55), (200, 500)),
+        ),
+        (0.6, 0.85),
+    ),
+}
+
+# Per-scenario smoke detector ranges
+SMOKE_PROFILES = {
+    "fire": {"smoke": (150, 500), "temp": (35, 65), "co": (50, 200), "alarm": True},
+    "normal": {"smoke": (0, 10), "temp": (18, 24), "co": (0, 5), "alarm": False},
+}
 
 
 class SensorSimulator:
-    """Simulates realistic sensor data for different scenarios."""
+    """
+    Simulates realistic sensor data for different scenarios.
+    
+    Readings are in range by construction, so models are built with
+    model_construct() and skip Pydantic validation; the Field bounds in
+    models.py still apply to data arriving from real sensors.
+    """
     
     def __init__(self, scenario: Literal["normal", "intrusion", "fall", "fire"] = "normal"):
         self.scenario = scenario
+        
+        # The scenario is fixed, so resolve each sensor's profile once
+        self._accelerometer_profile = ACCELEROMETER_PROFILES.get(scenario, ACCELEROMETER_PROFILES["normal"])
+        self._heart_rate_profile = HEART_RATE_PROFILES.get(scenario, HEART_RATE_PROFILES["normal"])
+        self._audio_profile = AUDIO_PROFILES.get(scenario, AUDIO_PROFILES["normal"])
+        self._smoke_profile = SMOKE_PROFILES.get(scenario, SMOKE_PROFILES["normal"])
+        
+        # (x, y, z) bounds as arrays for whole-batch accelerometer draws
+        accel_ranges = np.array(self._accelerometer_profile[0], dtype=float)
+        self._accel_lows, self._accel_highs = accel_ranges[:, 0], accel_ranges[:, 1]
+        
+        self._rng = np.random.default_rng()
+        self._unit_buf: list[float] = []
     
-    def generate_accelerometer_data(self, device_id: str = "wearable_001") -> AccelerometerData:
+    def _unit(self) -> float:
+        """Next uniform [0, 1) draw, served from a block made in one NumPy call."""
+        if not self._unit_buf:
+            self._unit_buf = self._rng.random(RANDOM_BLOCK_SIZE).tolist()
+        return self._unit_buf.pop()
+    
+    def _uniform(self, low: float, high: float) -> float:
+        """Random float in [low, high)."""
+        return low + (high - low) * self._unit()
+    
+    def _randint(self, low: int, high: int) -> int:
+        """Random integer in [low, high], inclusive like random.randint."""
+        return low + int((high - low + 1) * self._unit())
+    
+    def _choice(self, seq):
+        """Random element of a sequence."""
+        return seq[int(len(seq) * self._unit())]
+    
+    def generate_accelerometer_data(self, device_id: str = ACCELEROMETER_ID) -> AccelerometerData:
         """Generate accelerometer data based on scenario."""
-        timestamp = time.time()
+        return AccelerometerData.model_construct(**self._accelerometer_dict(device_id))
+    
+    def _accelerometer_dict(
+        self,
+        device_id: str = ACCELEROMETER_ID,
+        timestamp: Optional[float] = None
+    ) -> dict[str, Any]:
+        """Accelerometer reading as a plain dict (AccelerometerData fields)."""
+        if timestamp is None:
+            timestamp = time.time()
+        ranges, event_type = self._accelerometer_profile
+        x, y, z = (self._uniform(low, high) for low, high in ranges)
+        magnitude = hypot(x, y, z)
         
-        if self.scenario == "fall":
-            x, y = random.uniform(-2, 2), random.uniform(-2, 2)
-            z = random.uniform(-25, -15)
-            event_type = "fall"
-        elif self.scenario == "intrusion":
-            x = random.uniform(-15, 15)
-            y = random.uniform(-15, 15)
-            z = random.uniform(-15, 15)
-            event_type = "violent_shake"
-        else:
-            x, y = random.uniform(-1.5, 1.5), random.uniform(-1.5, 1.5)
-            z = random.uniform(9.5, 10.5)
-            event_type = "normal"
+        return {
+            "device_id": device_id, "timestamp": timestamp,
+            "x_axis": x, "y_axis": y, "z_axis": z,
+            "magnitude": magnitude, "event_type": event_type
+        }
+    
+    def generate_accelerometer_batch(
+        self,
+        n: int,
+        device_ids: Optional[list[str]] = None
+    ) -> dict[str, Any]:
+        """
+        Generate readings for n wearables at once as column arrays.
         
-        magnitude = (x**2 + y**2 + z**2) ** 0.5
+        Args:
+            n: Number of samples
+            device_ids: One ID per sample (default: wearable_001..n)
+            
+        Returns:
+            AccelerometerData fields as NumPy arrays, plus a boolean
+            "fall_threshold_exceeded" mask (magnitude > FALL_MAGNITUDE)
+        """
+        event_type = self._accelerometer_profile[1]
+        if NUMBA_AVAILABLE:
+            # Scale the draws and take norms in one fused, multi-core pass
+            xyz = self._rng.random((n, 3))
+            magnitude = np.empty(n)
+            scale_accelerometer_batch(xyz, self._accel_lows, self._accel_highs, magnitude)
+        else:
+            xyz = self._rng.uniform(self._accel_lows, self._accel_highs, size=(n, 3))
+            magnitude = np.linalg.norm(xyz, axis=1)
+        x, y, z = xyz.T
         
-        return AccelerometerData(
-            device_id=device_id, timestamp=timestamp,
-            x_axis=x, y_axis=y, z_axis=z,
-            magnitude=magnitude, event_type=event_type
-        )
+        return {
+            "device_id": device_ids or [f"wearable_{i:03d}" for i in range(1, n + 1)],
+            "timestamp": np.full(n, time.time()),
+            "x_axis": x, "y_axis": y, "z_axis": z,
+            "magnitude": magnitude,
+            "event_type": np.full(n, event_type),
+            "fall_threshold_exceeded": magnitude > FALL_MAGNITUDE
+        }
     
-    def generate_heart_rate_data(self, device_id: str = "smartwatch_001") -> HeartRateData:
+    def generate_heart_rate_data(self, device_id: str = HEART_RATE_ID) -> HeartRateData:
         """Generate heart rate data based on scenario."""
-        timestamp = time.time()
-        
-        if self.scenario == "fall":
-            heart_rate = random.randint(45, 60)
-            oxygen_saturation = random.uniform(85, 92)
-            bp_systolic = random.randint(85, 100)
-            bp_diastolic = random.randint(50, 65)
-            anomaly = True
-        elif self.scenario == "intrusion":
-            heart_rate = random.randint(120, 150)
-            oxygen_saturation = random.uniform(94, 98)
-            bp_systolic = random.randint(140, 170)
-            bp_diastolic = random.randint(90, 105)
-            anomaly = True
-        else:
-            heart_rate = random.randint(60, 80)
-            oxygen_saturation = random.uniform(96, 99)
-            bp_systolic = random.randint(110, 130)
-            bp_diastolic = random.randint(70, 85)
-            anomaly = False
+        return HeartRateData.model_construct(**self._heart_rate_dict(device_id))
+    
+    def _heart_rate_dict(
+        self,
+        device_id: str = HEART_RATE_ID,
+        timestamp: Optional[float] = None
+    ) -> dict[str, Any]:
+        """Heart rate reading as a plain dict (HeartRateData fields)."""
+        if timestamp is None:
+            timestamp = time.time()
+        profile = self._heart_rate_profile
         
-        return HeartRateData(
-            device_id=device_id, timestamp=timestamp,
-            heart_rate=heart_rate,
-            oxygen_saturation=oxygen_saturation,
-            blood_pressure_systolic=bp_systolic,
-            blood_pressure_diastolic=bp_diastolic,
-            anomaly=anomaly
-        )
-    
-    def generate_audio_data(self, device_id: str = "mic_001") -> AudioData:
+        return {
+            "device_id": device_id, "timestamp": timestamp,
+            "heart_rate": self._randint(*profile["hr"]),
+            "oxygen_saturation": self._uniform(*profile["spo2"]),
+            "blood_pressure_systolic": self._randint(*profile["sys"]),
+            "blood_pressure_diastolic": self._randint(*profile["dia"]),
+            "anomaly": profile["anomaly"]
+        }
+    
+    def generate_audio_data(self, device_id: str = AUDIO_ID) -> AudioData:
         """Generate audio event data based on scenario."""
-        timestamp = time.time()
+        return AudioData.model_construct(**self._audio_dict(device_id))
+    
+    def _audio_dict(
+        self,
+        device_id: str = AUDIO_ID,
+        timestamp: Optional[float] = None
+    ) -> dict[str, Any]:
+        """Audio event as a plain dict (AudioData fields)."""
+        if timestamp is None:
+            timestamp = time.time()
+        events, confidence_range = self._audio_profile
         
-        if self.scenario == "intrusion":
-            events = [
-                ("scream", random.uniform(85, 105), random.uniform(800, 1200)),
-                ("glass_breaking", random.uniform(90, 110), random.uniform(2000, 4000)),
-                ("door_slam", random.uniform(85, 95), random.uniform(100, 300)),
-            ]
-            event_choice = random.choice(events)
-            event_classification = event_choice[0]
-            sound_level = event_choice[1]
-            frequency = event_choice[2]
-            confidence = random.uniform(0.75, 0.95)
-        elif self.scenario == "fire":
-            event_classification = "alarm"
-            sound_level = random.uniform(95, 110)
-            frequency = random.uniform(2000, 3500)
-            confidence = random.uniform(0.85, 0.98)
-        else:
-            event_classification = random.choice(["silence", "normal_speech"])
-            sound_level = (
-                random.uniform(30, 55) if event_classification == "normal_speech"
-                else random.uniform(15, 30)
-            )
-            frequency = random.uniform(200, 500)
-            confidence = random.uniform(0.6, 0.85)
+        # Pick the event first so only its ranges are sampled
+        event_classification, sound_range, frequency_range = self._choice(events)
         
-        return AudioData(
-            device_id=device_id, timestamp=timestamp,
-            sound_level_db=sound_level, frequency_hz=frequency,
-            event_classification=event_classification,
-            confidence=confidence
-        )
-    
-    def generate_smoke_detector_data(self, device_id: str = "smoke_001") -> SmokeDetectorData:
+        return {
+            "device_id": device_id, "timestamp": timestamp,
+            "sound_level_db": self._uniform(*sound_range),
+            "frequency_hz": self._uniform(*frequency_range),
+            "event_classification": event_classification,
+            "confidence": self._uniform(*confidence_range)
+        }
+    
+    def generate_smoke_detector_data(self, device_id: str = SMOKE_DETECTOR_ID) -> SmokeDetectorData:
         """Generate smoke detector data based on scenario."""
-        timestamp = time.time()
-        
-        if self.scenario == "fire":
-            smoke_level = random.uniform(150, 500)
-            temperature = random.uniform(35, 65)
-            co_level = random.uniform(50, 200)
-            alarm = True
-        else:
-            smoke_level = random.uniform(0, 10)
-            temperature = random.uniform(18, 24)
-            co_level = random.uniform(0, 5)
-            alarm = False
+        return SmokeDetectorData.model_construct(**self._smoke_detector_dict(device_id))
+    
+    def _smoke_detector_dict(
+        self,
+        device_id: str = SMOKE_DETECTOR_ID,
+        timestamp: Optional[float] = None
+    ) -> dict[str, Any]:
+        """Smoke detector reading as a plain dict (SmokeDetectorData fields)."""
+        if timestamp is None:
+            timestamp = time.time()
+        profile = self._smoke_profile
         
-        return SmokeDetectorData(
-            device_id=device_id, timestamp=timestamp,
-            smoke_level_ppm=smoke_level,
-            temperature_celsius=temperature,
-            co_level_ppm=co_level,
-            alarm_triggered=alarm
-        )
+        return {
+            "device_id": device_id, "timestamp": timestamp,
+            "smoke_level_ppm": self._uniform(*profile["smoke"]),
+            "temperature_celsius": self._uniform(*profile["temp"]),
+            "co_level_ppm": self._uniform(*profile["co"]),
+            "alarm_triggered": profile["alarm"]
+        }
     
     def generate_batch(self) -> dict[str, Any]:
         """Generate complete sensor batch."""
+        # Plain dicts: the batch is serialized straight away, so model
+        # construction and model_dump() would be pure overhead. The clock
+        # is read once and shared, as the readings describe one instant.
+        timestamp = time.time()
         return {
-            "accelerometer": self.generate_accelerometer_data().model_dump(),
-            "heart_rate": self.generate_heart_rate_data().model_dump(),
-            "audio": self.generate_audio_data().model_dump(),
-            "smoke_detector": self.generate_smoke_detector_data().model_dump(),
+            "accelerometer": self._accelerometer_dict(timestamp=timestamp),
+            "heart_rate": self._heart_rate_dict(timestamp=timestamp),
+            "audio": self._audio_dict(timestamp=timestamp),
+            "smoke_detector": self._smoke_detector_dict(timestamp=timestamp),
         }
+    
+    def generate_batch_json(self) -> bytes:
+        """Generate a complete sensor batch encoded as compact JSON bytes."""
+        return compact_json_bytes(self.generate_batch())
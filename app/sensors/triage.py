@@ -0,0 +1,82 @@
+"""Deterministic sensor triage against the sensor agent's thresholds."""
+
+from typing import Any
+
+from .fast_kernels import njit
+
+
+# Triage results, ordered like threat levels
+NONE, GRAY_ZONE, MEDIUM, HIGH, CRITICAL = range(5)
+
+# Audio classes as kernel inputs; ids at or above AUDIO_THREAT_ID are threats
+AUDIO_CLASS_IDS = {
+    "silence": 0,
+    "normal_speech": 1,
+    "loud_noise": 2,
+    "door_slam": 3,
+    "alarm": 4,
+    "scream": 5,
+    "glass_breaking": 6,
+}
+AUDIO_NORMAL_MAX_ID = 1
+AUDIO_THREAT_ID = 5
+
+# Alert thresholds from the sensor agent instruction
+MIN_HEART_RATE = 50
+MAX_HEART_RATE = 120
+CRITICAL_OXYGEN = 90.0
+FALL_MAGNITUDE = 20.0
+FIRE_SMOKE_PPM = 100.0
+
+# Readings well inside those thresholds, with a margin so that gray-zone
+# values still go to the LLM
+NORMAL_HEART_RATE = (55, 110)
+MIN_NORMAL_OXYGEN = 94.0
+MAX_NORMAL_MAGNITUDE = 15.0
+MAX_NORMAL_SMOKE_PPM = 50.0
+MAX_NORMAL_CO_PPM = 35.0
+
+
+@njit(cache=True)
+def triage(
+    heart_rate: float,
+    oxygen: float,
+    magnitude: float,
+    smoke_ppm: float,
+    co_ppm: float,
+    audio_id: int,
+    alarm: bool
+) -> int:
+    """Classify one sensor batch; see the NONE..CRITICAL constants."""
+    if oxygen < CRITICAL_OXYGEN or smoke_ppm > FIRE_SMOKE_PPM or alarm:
+        return CRITICAL
+    if magnitude > FALL_MAGNITUDE:
+        return HIGH
+    if heart_rate < MIN_HEART_RATE or heart_rate > MAX_HEART_RATE or audio_id >= AUDIO_THREAT_ID:
+        return MEDIUM
+    if (
+        heart_rate < NORMAL_HEART_RATE[0]
+        or heart_rate > NORMAL_HEART_RATE[1]
+        or oxygen < MIN_NORMAL_OXYGEN
+        or magnitude > MAX_NORMAL_MAGNITUDE
+        or smoke_ppm > MAX_NORMAL_SMOKE_PPM
+        or co_ppm > MAX_NORMAL_CO_PPM
+        or audio_id > AUDIO_NORMAL_MAX_ID
+    ):
+        return GRAY_ZONE
+    return NONE
+
+
+def triage_sensor_data(sensor_data: dict[str, Any]) -> int:
+    """Run `triage` on a SensorSimulator.generate_batch() dict."""
+    heart_rate = sensor_data["heart_rate"]
+    smoke = sensor_data["smoke_detector"]
+    return triage(
+        float(heart_rate["heart_rate"]),
+        float(heart_rate["oxygen_saturation"]),
+        float(sensor_data["accelerometer"]["magnitude"]),
+        float(smoke["smoke_level_ppm"]),
+        float(smoke["co_level_ppm"]),
+        AUDIO_CLASS_IDS.get(sensor_data["audio"]["event_classification"], AUDIO_THREAT_ID),
+        bool(smoke["alarm_triggered"])
+    )
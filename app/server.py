@@ -88,6 +88,8 @@ async def monitor_threats():
             
         except Exception as e:
             print(f"Error in monitoring: {e}")
+        finally:
+            pipeline.close()
         
         # Rotate scenario every 4 cycles
         current_scenario += 1
@@ -137,7 +139,10 @@ async def simulate_scenario(scenario: str):
         return {"error": "Invalid scenario"}
     
     pipeline = ThreatDetectionPipeline(VIDEO_PATHS, scenario)
-    result = await pipeline.process_cycle()
+    try:
+        result = await pipeline.process_cycle()
+    finally:
+        pipeline.close()
     
     # Broadcast result
     await manager.broadcast({
@@ -10,6 +10,7 @@ from google.adk.sessions import InMemorySessionService
 from google.genai import types
 
 from app.sensors.simulator import SensorSimulator
+from app.utils.serialization import compact_json
 from app.agents.sensor_agent import create_sensor_agent
 from app.agents.orchestrator_agent import create_orchestrator_agent
 
@@ -54,7 +55,7 @@ async def analyze_sensors(sensor_data: dict) -> str:
     
     content = types.Content(
         role="user",
-        parts=[types.Part(text=f"Analyze this sensor data:\n{json.dumps(sensor_data, indent=2)}")]
+        parts=[types.Part(text=f"Analyze this sensor data:\n{compact_json(sensor_data)}")]
     )
     
     response_text = ""
@@ -1,9 +1,12 @@
 """Single analysis pipeline - analyze current state only."""
 
 import asyncio
-import json
+import atexit
 import logging
 import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -18,6 +21,7 @@ from google.genai import types
 from app.agents.sensor_agent import create_sensor_agent
 from app.agents.orchestrator_agent import create_orchestrator_agent
 from app.sensors.simulator import SensorSimulator
+from app.utils.serialization import compact_json
 from app.video.full_video_analyzer import analyze_full_video
 
 logging.basicConfig(
@@ -26,6 +30,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Result reports are written to stdout on a listener thread so that
+# formatting and terminal I/O stay off the event loop.
+_results_queue = queue.Queue(-1)
+_results_listener = QueueListener(_results_queue, logging.StreamHandler(sys.stdout))
+_results_listener.start()
+atexit.register(_results_listener.stop)
+
+results_logger = logging.getLogger(f"{__name__}.results")
+results_logger.addHandler(QueueHandler(_results_queue))
+results_logger.setLevel(logging.INFO)
+results_logger.propagate = False
+
+# Frames buffered per camera between extraction and the remote vision
+# calls; bounds host memory, so set FRAME_BATCH_SIZE to trade it for overlap
+BATCH_SIZE = int(os.getenv("FRAME_BATCH_SIZE", "16"))
+
 
 async def analyze_sensors(sensor_data: dict) -> dict:
     """Analyze sensor data."""
@@ -46,7 +66,7 @@ async def analyze_sensors(sensor_data: dict) -> dict:
     
     content = types.Content(
         role="user",
-        parts=[types.Part(text=f"Analyze this sensor data:\n{json.dumps(sensor_data, indent=2)}")]
+        parts=[types.Part(text=f"Analyze this sensor data:\n{compact_json(sensor_data)}")]
     )
     
     async for event in runner.run_async(
@@ -65,9 +85,26 @@ async def analyze_sensors(sensor_data: dict) -> dict:
     return session.state.get("sensor_analysis", {})
 
 
+def _list_video_dirs(video_files: Dict[int, str]) -> Dict[str, set]:
+    """
+    Scan each video directory once and return the file names present.
+    
+    Names are os.path.normcase'd, so lookups must normcase too.
+    """
+    present = {}
+    for video_dir in {str(Path(v).parent) for v in video_files.values() if v}:
+        try:
+            with os.scandir(video_dir) as entries:
+                present[video_dir] = {os.path.normcase(e.name) for e in entries}
+        except OSError:
+            present[video_dir] = set()
+    return present
+
+
 async def analyze_cameras(video_files: Dict[int, str]) -> list:
     """Analyze all 5 camera feeds."""
     camera_analyses = []
+    present_files = _list_video_dirs(video_files)
     
     # Always check all 5 cameras
     for camera_id in range(1, 6):
@@ -86,7 +123,11 @@ async def analyze_cameras(video_files: Dict[int, str]) -> list:
             })
             continue
         
-        if not Path(video_path).exists():
+        path = Path(video_path)
+        # normcase matches case-insensitively on Windows; exists() covers
+        # other case-insensitive filesystems (e.g. macOS) on a miss
+        listed = os.path.normcase(path.name) in present_files.get(str(path.parent), set())
+        if not listed and not path.exists():
             logger.warning(f"Camera {camera_id}: Video file not found - {video_path}")
             camera_analyses.append({
                 "camera_id": camera_id,
@@ -105,7 +146,8 @@ async def analyze_cameras(video_files: Dict[int, str]) -> list:
             analysis = await analyze_full_video(
                 video_path=video_path,
                 camera_id=camera_id,
-                scenario=""  # No scenario - pure analysis
+                scenario="",  # No scenario - pure analysis
+                batch_size=BATCH_SIZE
             )
             camera_analyses.append(analysis)
         except Exception as e:
@@ -241,30 +283,32 @@ async def analyze_current_state(video_files: Dict[int, str], sensor_data: Option
 
 
 def print_results(result: dict):
-    """Print analysis results."""
+    """Print analysis results via the background results logger."""
     sensor_analysis = result["sensor_analysis"]
     camera_analyses = result["camera_analyses"]
     decision = result["decision"]
     
-    print(f"\n{'='*100}")
-    print("HOME THREAT DETECTION - LIVE ANALYSIS")
-    print(f"{'='*100}")
+    lines = [
+        f"\n{'='*100}",
+        "HOME THREAT DETECTION - LIVE ANALYSIS",
+        f"{'='*100}",
+    ]
     
-    print(f"\n[SENSORS] {sensor_analysis.get('threat_level', 'unknown').upper()}")
-    print(f"  Fall: {'YES' if sensor_analysis.get('fall_detected') else 'NO'} | "
-          f"Vitals: {'ANOMALY' if sensor_analysis.get('vital_anomaly') else 'NORMAL'} | "
-          f"Fire: {'YES' if sensor_analysis.get('fire_detected') else 'NO'}")
+    lines.append(f"\n[SENSORS] {sensor_analysis.get('threat_level', 'unknown').upper()}")
+    lines.append(f"  Fall: {'YES' if sensor_analysis.get('fall_detected') else 'NO'} | "
+                 f"Vitals: {'ANOMALY' if sensor_analysis.get('vital_anomaly') else 'NORMAL'} | "
+                 f"Fire: {'YES' if sensor_analysis.get('fire_detected') else 'NO'}")
     
-    print(f"\n[CAMERAS - All 5 Camera System]")
+    lines.append(f"\n[CAMERAS - All 5 Camera System]")
     online_count = 0
     for cam in camera_analyses:
         cam_id = cam['camera_id']
         status = cam.get('status')
         
         if status == "not_configured":
-            print(f"  Camera {cam_id}: NOT CONFIGURED")
+            lines.append(f"  Camera {cam_id}: NOT CONFIGURED")
         elif cam.get("error"):
-            print(f"  Camera {cam_id}: {status.upper()}")
+            lines.append(f"  Camera {cam_id}: {status.upper()}")
         else:
             online_count += 1
             threat = cam.get('threat_level', 'unknown').upper()
@@ -273,24 +317,26 @@ def print_results(result: dict):
             frames = cam.get('total_frames_analyzed', 0)
             duration = cam.get('video_duration', 0)
             
-            print(f"  Camera {cam_id}: {threat} | Weapon: {weapon} | People: {people} | "
-                  f"{frames} frames ({duration:.1f}s)")
+            lines.append(f"  Camera {cam_id}: {threat} | Weapon: {weapon} | People: {people} | "
+                         f"{frames} frames ({duration:.1f}s)")
             
             if cam.get('weapons_detected'):
-                print(f"    → Weapon detected in {len(cam['weapons_detected'])} frames")
+                lines.append(f"    → Weapon detected in {len(cam['weapons_detected'])} frames")
             if cam.get('unfamiliar_face'):
-                print(f"    → Unknown person detected")
-    
-    print(f"\n  Status: {online_count}/5 cameras online")
-    
-    print(f"\n{'='*100}")
-    print(f"[FINAL THREAT ASSESSMENT] {decision.get('threat_level', 'unknown').upper()}")
-    print(f"{'='*100}")
-    print(f"  Action Required: {decision.get('action_required', 'none').upper()}")
-    print(f"  Emergency Response: {'CALL 911 NOW' if decision.get('call_911') else 'Not Required'}")
-    print(f"\n  Reasoning: {decision.get('reasoning', 'No reasoning provided')}")
-    print(f"\n  Alert: {decision.get('message_to_user', 'N/A')}")
-    print(f"\n{'='*100}\n")
+                lines.append(f"    → Unknown person detected")
+    
+    lines.append(f"\n  Status: {online_count}/5 cameras online")
+    
+    lines.append(f"\n{'='*100}")
+    lines.append(f"[FINAL THREAT ASSESSMENT] {decision.get('threat_level', 'unknown').upper()}")
+    lines.append(f"{'='*100}")
+    lines.append(f"  Action Required: {decision.get('action_required', 'none').upper()}")
+    lines.append(f"  Emergency Response: {'CALL 911 NOW' if decision.get('call_911') else 'Not Required'}")
+    lines.append(f"\n  Reasoning: {decision.get('reasoning', 'No reasoning provided')}")
+    lines.append(f"\n  Alert: {decision.get('message_to_user', 'N/A')}")
+    lines.append(f"\n{'='*100}\n")
+    
+    results_logger.info("\n".join(lines))
 
 
 async def main():
@@ -2,16 +2,32 @@
 
 import re
 import logging
-from typing import Any
+from collections import Counter, defaultdict
+from itertools import islice
+from typing import Any, Optional
 from google.adk.agents import Agent
 from google.adk.tools import ToolContext
 from pydantic import BaseModel, Field
 
 from app.temporal.vector_store import TemporalVectorStore
+from app.sensors.models import THREAT_ORDER, THREAT_RANK
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_CAMERA_RE = re.compile(r'camera\s*(\d+)|cam\s*(\d+)|video\s*(\d+)')
+
+# One store (Pinecone connection, mirror and embedder) shared by all tool calls
+_VECTOR_STORE = None
+
+
+def _get_vector_store() -> TemporalVectorStore:
+    """Return the shared vector store, creating it on first use."""
+    global _VECTOR_STORE
+    if _VECTOR_STORE is None:
+        _VECTOR_STORE = TemporalVectorStore()
+    return _VECTOR_STORE
+
 
 class TimeRange(BaseModel):
     """Extracted time range from query."""
@@ -20,6 +36,14 @@ class TimeRange(BaseModel):
     camera_id: int = Field(description="Camera ID")
 
 
+def _extract_camera_id(query_lower: str) -> Optional[int]:
+    """Return the camera ID mentioned in a lowercased query, if any."""
+    match = _CAMERA_RE.search(query_lower)
+    if not match:
+        return None
+    return int(next(group for group in match.groups() if group))
+
+
 def parse_time_query(query: str) -> dict[str, Any]:
     """
     Parse natural language time queries.
@@ -31,12 +55,13 @@ def parse_time_query(query: str) -> dict[str, Any]:
     - "at 2 minutes" -> {"start": 120, "end": 125}
     """
     query_lower = query.lower()
-    
-    # Extract camera ID
-    camera_match = re.search(r'camera\s*(\d+)|cam\s*(\d+)|video\s*(\d+)', query_lower)
-    camera_id = 1  # Default
-    if camera_match:
-        camera_id = int(camera_match.group(1) or camera_match.group(2) or camera_match.group(3))
+    return _parse_time_range(query_lower, _extract_camera_id(query_lower))
+
+
+def _parse_time_range(query_lower: str, camera_id: Optional[int]) -> dict[str, Any]:
+    """Match time-range patterns in an already lowercased query."""
+    if camera_id is None:
+        camera_id = 1  # Default
     
     # Pattern: "between X and Y seconds"
     between_pattern = r'between\s+(\d+)\s+and\s+(\d+)\s+seconds?'
@@ -123,11 +148,12 @@ def query_temporal_events(
     """
     logger.info(f"Processing temporal query: {query}")
     
-    # Initialize vector store
-    vector_store = TemporalVectorStore()
+    vector_store = _get_vector_store()
     
-    # Parse time-based query
-    time_params = parse_time_query(query)
+    # Parse time-based query, scanning for the camera ID only once
+    query_lower = query.lower()
+    camera_id_hint = _extract_camera_id(query_lower)
+    time_params = _parse_time_range(query_lower, camera_id_hint)
     
     if time_params:
         # Time-based query
@@ -154,21 +180,21 @@ def query_temporal_events(
             }
         
         # Generate summary
-        threat_counts = {}
+        levels = [insight.get('threat_level', 'none') for insight in insights]
+        threat_counts = dict(Counter(levels))
         weapon_detected = False
-        max_threat_level = "none"
-        threat_levels = {"none": 0, "low": 1, "medium": 2, "high": 3, "critical": 4}
+        max_rank = 0
         
-        for insight in insights:
-            threat_level = insight.get('threat_level', 'none')
-            threat_counts[threat_level] = threat_counts.get(threat_level, 0) + 1
-            
-            if threat_levels.get(threat_level, 0) > threat_levels.get(max_threat_level, 0):
-                max_threat_level = threat_level
+        for insight, threat_level in zip(insights, levels):
+            rank = THREAT_RANK.get(threat_level, 0)
+            if rank > max_rank:
+                max_rank = rank
             
             if insight.get('weapon_type', 'none') != 'none':
                 weapon_detected = True
         
+        max_threat_level = THREAT_ORDER[max_rank]
+        
         return {
             "status": "success",
             "message": f"Found {len(insights)} events in the specified time range",
@@ -187,9 +213,8 @@ def query_temporal_events(
         # Semantic search query
         logger.info("Executing semantic search query")
         
-        # Extract camera ID if mentioned
-        camera_match = re.search(r'camera\s*(\d+)|cam\s*(\d+)|video\s*(\d+)', query.lower())
-        camera_id = int(camera_match.group(1) or camera_match.group(2) or camera_match.group(3)) if camera_match else None
+        # Camera ID if mentioned
+        camera_id = camera_id_hint
         
         insights = vector_store.query_by_semantic_search(
             query_text=query,
@@ -235,30 +260,21 @@ def get_threat_timeline(
     """
     logger.info(f"Fetching threat timeline for camera {camera_id}")
     
-    vector_store = TemporalVectorStore()
-    
-    # Query all events for this camera (use large time range)
-    insights = vector_store.query_by_time_range(
-        camera_id=camera_id,
-        start_time=0.0,
-        end_time=999999.0,  # Large number to get all events
-        top_k=100
-    )
+    vector_store = _get_vector_store()
     
-    # Group by threat level
-    by_threat = {}
-    for insight in insights:
-        level = insight.get('threat_level', 'none')
-        if level not in by_threat:
-            by_threat[level] = []
-        by_threat[level].append(insight)
+    # Stream events page by page, grouping by threat level as they arrive
+    timeline = []
+    by_threat = defaultdict(list)
+    for insight in islice(vector_store.iter_by_camera(camera_id, page_size=50), 100):
+        timeline.append(insight)
+        by_threat[insight.get('threat_level', 'none')].append(insight)
     
     return {
         "status": "success",
         "camera_id": camera_id,
-        "total_events": len(insights),
-        "timeline": insights,
-        "by_threat_level": by_threat,
+        "total_events": len(timeline),
+        "timeline": timeline,
+        "by_threat_level": dict(by_threat),
         "summary": {
             "critical": len(by_threat.get('critical', [])),
             "high": len(by_threat.get('high', [])),
@@ -1,15 +1,93 @@
 """Temporal vector storage for threat detection insights using Pinecone."""
 
 import os
+import json
 import logging
-from typing import Any, Optional
+import sqlite3
 from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterator, Optional
+import time
 import pinecone
-from sentence_transformers import SentenceTransformer
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+# Dynamically quantized INT8 ONNX export published alongside the model
+ONNX_INT8_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+# Static (transformer-free) embeddings distilled with Model2Vec
+MODEL2VEC_MODEL = "minishlab/potion-base-8M"
+
+EMBEDDING_DIMENSIONS = {
+    "sentence-transformers": 384,
+    "model2vec": 256,
+}
+# Scene descriptions are capped so embedding inputs stay short and uniform
+MAX_DESCRIPTION_CHARS = 200
+
+# Metadata mirrors live here unless THREAT_METADATA_DB names a file
+DEFAULT_DATA_DIR = Path.home() / ".threat-detection"
+
+# Pinecone's maximum top_k, used when the mirror can't serve a query
+PINECONE_MAX_TOP_K = 10000
+
+
+def _load_embedder(backend: str = "sentence-transformers"):
+    """
+    Load the embedding model for a backend.
+    
+    "sentence-transformers" uses the INT8 ONNX MiniLM export, falling back
+    to the PyTorch weights. "model2vec" uses a static token-embedding model
+    that needs no transformer forward pass.
+    """
+    if backend == "model2vec":
+        from model2vec import StaticModel
+        return StaticModel.from_pretrained(MODEL2VEC_MODEL)
+    
+    # Imported here: pulls in transformers/torch, which metadata-only
+    # callers never need
+    from sentence_transformers import SentenceTransformer
+    
+    try:
+        return SentenceTransformer(
+            EMBEDDING_MODEL,
+            backend="onnx",
+            model_kwargs={
+                "file_name": ONNX_INT8_FILE,
+                "provider": "CPUExecutionProvider"
+            }
+        )
+    except Exception as e:
+        logger.warning(f"INT8 ONNX embedder unavailable ({e}), using PyTorch backend")
+        return SentenceTransformer(EMBEDDING_MODEL)
+
+
+def _ingestion_epoch(value: Any) -> Optional[float]:
+    """
+    Ingestion time as epoch seconds.
+    
+    Records written before ingestion_time became numeric hold an ISO string.
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+def _format_insight(insight: dict[str, Any]) -> dict[str, Any]:
+    """Render a stored insight's epoch ingestion_time as an ISO string."""
+    ingestion_time = insight.get("ingestion_time")
+    if isinstance(ingestion_time, (int, float)):
+        insight["ingestion_time"] = datetime.fromtimestamp(ingestion_time).isoformat()
+    return insight
+
 
 class TemporalVectorStore:
     """
@@ -20,17 +98,28 @@ class TemporalVectorStore:
     def __init__(
         self,
         index_name: str = "threat-insights",
-        dimension: int = 384,  # all-MiniLM-L6-v2 dimension
-        metric: str = "cosine"
+        dimension: Optional[int] = None,
+        metric: str = "cosine",
+        embedding_backend: str = "sentence-transformers",
+        metadata_db_path: Optional[str] = None
     ):
         """
         Initialize the temporal vector store.
         
         Args:
             index_name: Name of the Pinecone index
-            dimension: Vector dimension (384 for all-MiniLM-L6-v2)
+            dimension: Vector dimension (defaults to the embedding backend's:
+                384 for all-MiniLM-L6-v2, 256 for potion-base-8M)
             metric: Distance metric for similarity search
+            embedding_backend: "sentence-transformers" or "model2vec". Indexes
+                are dimension-specific, so use a separate index_name per backend.
+            metadata_db_path: SQLite file mirroring insight metadata for
+                time-range and threat-level queries (default: THREAT_METADATA_DB,
+                else <THREAT_DATA_DIR or ~/.threat-detection>/<index_name>.db)
         """
+        if embedding_backend not in EMBEDDING_DIMENSIONS:
+            raise ValueError(f"Unknown embedding backend: {embedding_backend}")
+        
         # Initialize Pinecone
         api_key = os.getenv("PINECONE_API_KEY")
         if not api_key:
@@ -38,17 +127,39 @@ class TemporalVectorStore:
         
         pinecone.init(api_key=api_key, environment=os.getenv("PINECONE_ENVIRONMENT", "gcp-starter"))
         self.index_name = index_name
-        self.dimension = dimension
+        self.dimension = dimension or EMBEDDING_DIMENSIONS[embedding_backend]
+        # Query vector for metadata-only Pinecone queries, built once
+        self._zero_vector = [0.0] * self.dimension
         
-        # Initialize embedding model (lightweight and fast)
-        logger.info("Loading embedding model...")
-        self.embedder = SentenceTransformer('all-MiniLM-L6-v2')
+        # Embedding model is loaded on first use (see the embedder property)
+        self.embedding_backend = embedding_backend
+        self._embedder = None
+        
+        # upsert_analysis accumulates vectors and sends them in one request
+        self._write_buf: list[dict[str, Any]] = []
+        self._write_buf_limit = 64
         
         # Create or connect to index
         self._initialize_index(metric)
         
+        # Local metadata mirror serves non-semantic queries without Pinecone
+        self._initialize_metadata_db(
+            metadata_db_path
+            or os.getenv("THREAT_METADATA_DB")
+            or Path(os.getenv("THREAT_DATA_DIR", DEFAULT_DATA_DIR)) / f"{index_name}.db"
+        )
+        self._sync_metadata_db()
+        
         logger.info(f"Temporal vector store initialized with index: {index_name}")
     
+    @property
+    def embedder(self):
+        """Embedding model, loaded on first access."""
+        if self._embedder is None:
+            logger.info(f"Loading {self.embedding_backend} embedding model...")
+            self._embedder = _load_embedder(self.embedding_backend)
+        return self._embedder
+    
     def _initialize_index(self, metric: str):
         """Create Pinecone index if it doesn't exist."""
         existing_indexes = pinecone.list_indexes()
@@ -61,12 +172,163 @@ class TemporalVectorStore:
                 metric=metric
             )
         
-        self.index = pinecone.Index(self.index_name)
+        # Thread pool lets chunked upserts overlap their HTTPS round-trips
+        self.index = pinecone.Index(self.index_name, pool_threads=30)
         logger.info(f"Connected to index: {self.index_name}")
     
+    def _initialize_metadata_db(self, path):
+        """Open the SQLite metadata mirror, creating its schema if needed."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.meta_db = sqlite3.connect(path, check_same_thread=False)
+        self.meta_db.create_function(
+            "ingestion_epoch", 1, _ingestion_epoch, deterministic=True
+        )
+        self.meta_db.executescript("""
+            CREATE TABLE IF NOT EXISTS insights (
+                id TEXT PRIMARY KEY,
+                camera_id INTEGER NOT NULL,
+                timestamp REAL NOT NULL,
+                frame_number INTEGER NOT NULL,
+                threat_level TEXT NOT NULL,
+                session_id TEXT,
+                metadata TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS ix_cam_ts ON insights(camera_id, timestamp);
+            CREATE INDEX IF NOT EXISTS ix_threat ON insights(threat_level);
+            CREATE INDEX IF NOT EXISTS ix_session ON insights(session_id);
+            CREATE TABLE IF NOT EXISTS sync_state (
+                key TEXT PRIMARY KEY,
+                value REAL NOT NULL
+            );
+        """)
+        logger.info(f"Metadata mirror: {path}")
+    
+    def _sync_metadata_db(self):
+        """
+        Bring the mirror up to date with vectors written elsewhere.
+        
+        A mirror without a high-water mark (the newest ingestion_time it
+        holds) is backfilled from a full listing of the index. Otherwise only
+        vectors ingested after the mark are fetched, with one filtered query.
+        If either fails, metadata queries fall back to Pinecone filters.
+        """
+        self._mirror_synced = False
+        row = self.meta_db.execute(
+            "SELECT value FROM sync_state WHERE key = 'high_water'"
+        ).fetchone()
+        
+        try:
+            if row is None or not self._catch_up_metadata_db(row[0]):
+                logger.info("Backfilling metadata mirror from the index")
+                self._backfill_metadata_db()
+            self._mirror_synced = True
+        except Exception as e:
+            logger.warning(
+                f"Metadata mirror sync failed ({e}); "
+                "serving metadata queries from Pinecone"
+            )
+    
+    def _catch_up_metadata_db(self, high_water: float) -> bool:
+        """
+        Mirror vectors ingested after `high_water`.
+        
+        Returns False if the result was truncated at Pinecone's top_k limit,
+        in which case a full backfill is needed.
+        """
+        results = self.index.query(
+            vector=self._zero_vector,
+            filter={"ingestion_time": {"$gt": high_water}},
+            top_k=PINECONE_MAX_TOP_K,
+            include_metadata=True
+        )
+        matches = results['matches']
+        if len(matches) >= PINECONE_MAX_TOP_K:
+            return False
+        
+        if matches:
+            logger.info(f"Mirroring {len(matches)} vectors ingested since last sync")
+            self._mirror_vectors(
+                [{"id": match['id'], "metadata": match['metadata']} for match in matches]
+            )
+        return True
+    
+    def _backfill_metadata_db(self, batch_size: int = 100):
+        """Copy every vector's metadata from Pinecone into the mirror."""
+        id_pages = self.index.list()
+        ids = (record_id for page in id_pages for record_id in page)
+        while batch := list(islice(ids, batch_size)):
+            fetched = self.index.fetch(ids=batch)['vectors']
+            self._mirror_vectors([
+                {"id": record_id, "metadata": vector['metadata']}
+                for record_id, vector in fetched.items()
+            ])
+    
+    def _query_pinecone_metadata(
+        self,
+        filter_dict: dict[str, Any],
+        top_k: int
+    ) -> list[dict[str, Any]]:
+        """Metadata-filtered Pinecone query, for when the mirror is incomplete."""
+        results = self.index.query(
+            vector=self._zero_vector,  # Dummy vector for metadata-only query
+            filter=filter_dict or None,
+            top_k=top_k,
+            include_metadata=True
+        )
+        insights = [
+            _format_insight({"id": match['id'], **match['metadata']})
+            for match in results['matches']
+        ]
+        insights.sort(key=lambda x: (x.get('timestamp', 0), x['id']))
+        return insights
+    
+    def _mirror_vectors(self, vectors: list[dict[str, Any]]):
+        """Insert or replace vector metadata and advance the high-water mark."""
+        ingested = [
+            epoch for vector in vectors
+            if (epoch := _ingestion_epoch(vector["metadata"].get("ingestion_time"))) is not None
+        ]
+        with self.meta_db:
+            self.meta_db.executemany(
+                "INSERT OR REPLACE INTO insights "
+                "(id, camera_id, timestamp, frame_number, threat_level, session_id, metadata) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        vector["id"],
+                        vector["metadata"]["camera_id"],
+                        vector["metadata"]["timestamp"],
+                        vector["metadata"]["frame_number"],
+                        vector["metadata"]["threat_level"],
+                        vector["metadata"].get("session_id"),
+                        json.dumps(vector["metadata"])
+                    )
+                    for vector in vectors
+                ]
+            )
+            if ingested:
+                self.meta_db.execute(
+                    "INSERT INTO sync_state (key, value) VALUES ('high_water', ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = max(value, excluded.value)",
+                    (max(ingested),)
+                )
+    
+    def _query_metadata(self, where: str, params: tuple, limit: int) -> list[dict[str, Any]]:
+        """Select mirrored insights in chronological order."""
+        self.flush()
+        rows = self.meta_db.execute(
+            f"SELECT id, metadata FROM insights WHERE {where} "
+            f"ORDER BY timestamp, id LIMIT ?",
+            (*params, limit)
+        ).fetchall()
+        return [
+            _format_insight({"id": record_id, **json.loads(metadata)})
+            for record_id, metadata in rows
+        ]
+    
     def _create_embedding(self, text: str) -> list[float]:
         """Generate embedding vector from text."""
-        embedding = self.embedder.encode(text, convert_to_tensor=False)
+        embedding = self.embedder.encode(text)
         return embedding.tolist()
     
     def _create_searchable_text(self, analysis: dict[str, Any]) -> str:
@@ -105,42 +367,40 @@ class TemporalVectorStore:
         # Add description
         description = analysis.get('description', '')
         if description:
-            parts.append(f"Scene: {description}")
+            parts.append(f"Scene: {description[:MAX_DESCRIPTION_CHARS]}")
         
         return " | ".join(parts)
     
-    def upsert_analysis(
+    def _create_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for many texts in one batched encode."""
+        # Encode length-sorted so each mini-batch pads to a similar length
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        encoded = self.embedder.encode(
+            [texts[i] for i in order],
+            batch_size=64,
+            show_progress_bar=False
+        )
+        
+        embeddings = [None] * len(texts)
+        for position, i in enumerate(order):
+            embeddings[i] = encoded[position].tolist()
+        return embeddings
+    
+    def _build_vector(
         self,
         camera_id: int,
         timestamp: float,
         frame_number: int,
         analysis: dict[str, Any],
+        searchable_text: str,
+        embedding: list[float],
         video_path: Optional[str] = None,
         session_id: Optional[str] = None
-    ) -> str:
-        """
-        Store a vision analysis with temporal metadata.
-        
-        Args:
-            camera_id: Camera identifier
-            timestamp: Timestamp in seconds from video start
-            frame_number: Frame number in video
-            analysis: Vision analysis dictionary
-            video_path: Optional path to video file
-            session_id: Optional session identifier
-            
-        Returns:
-            Unique ID of the stored record
-        """
+    ) -> dict[str, Any]:
+        """Build a Pinecone vector record with temporal metadata."""
         # Create unique ID
         record_id = f"cam{camera_id}_f{frame_number}_{int(timestamp*1000)}"
         
-        # Create searchable text
-        searchable_text = self._create_searchable_text(analysis)
-        
-        # Generate embedding
-        embedding = self._create_embedding(searchable_text)
-        
         # Prepare metadata
         metadata = {
             "camera_id": camera_id,
@@ -153,7 +413,7 @@ class TemporalVectorStore:
             "threats": ",".join(analysis.get('threats_detected', [])),
             "description": analysis.get('description', '')[:1000],  # Pinecone metadata limit
             "searchable_text": searchable_text[:1000],
-            "ingestion_time": datetime.now().isoformat()
+            "ingestion_time": time.time()  # Epoch seconds; filterable with $gte/$lte
         }
         
         if video_path:
@@ -162,21 +422,138 @@ class TemporalVectorStore:
         if session_id:
             metadata["session_id"] = session_id
         
-        # Upsert to Pinecone
-        self.index.upsert(
-            vectors=[{
-                "id": record_id,
-                "values": embedding,
-                "metadata": metadata
-            }]
+        return {
+            "id": record_id,
+            "values": embedding,
+            "metadata": metadata
+        }
+    
+    def upsert_analysis(
+        self,
+        camera_id: int,
+        timestamp: float,
+        frame_number: int,
+        analysis: dict[str, Any],
+        video_path: Optional[str] = None,
+        session_id: Optional[str] = None
+    ) -> str:
+        """
+        Store a vision analysis with temporal metadata.
+        
+        Vectors are buffered and upserted in batches; call `flush()` or
+        `close()` to send any remainder.
+        
+        Args:
+            camera_id: Camera identifier
+            timestamp: Timestamp in seconds from video start
+            frame_number: Frame number in video
+            analysis: Vision analysis dictionary
+            video_path: Optional path to video file
+            session_id: Optional session identifier
+            
+        Returns:
+            Unique ID of the stored record
+        """
+        # Create searchable text
+        searchable_text = self._create_searchable_text(analysis)
+        
+        # Generate embedding
+        embedding = self._create_embedding(searchable_text)
+        
+        vector = self._build_vector(
+            camera_id=camera_id,
+            timestamp=timestamp,
+            frame_number=frame_number,
+            analysis=analysis,
+            searchable_text=searchable_text,
+            embedding=embedding,
+            video_path=video_path,
+            session_id=session_id
         )
         
+        self._write_buf.append(vector)
+        if len(self._write_buf) >= self._write_buf_limit:
+            self.flush()
+        
         logger.info(
-            f"Upserted analysis: camera={camera_id}, "
-            f"timestamp={timestamp:.1f}s, threat={metadata['threat_level']}"
+            f"Buffered analysis: camera={camera_id}, "
+            f"timestamp={timestamp:.1f}s, threat={vector['metadata']['threat_level']}"
         )
         
-        return record_id
+        return vector["id"]
+    
+    def flush(self):
+        """Upsert and mirror any vectors buffered by `upsert_analysis`."""
+        if not self._write_buf:
+            return
+        
+        self.index.upsert(vectors=self._write_buf)
+        self._mirror_vectors(self._write_buf)
+        logger.info(f"Flushed {len(self._write_buf)} buffered analyses")
+        self._write_buf.clear()
+    
+    def close(self):
+        """Flush buffered writes and close the metadata mirror."""
+        self.flush()
+        self.meta_db.close()
+    
+    def __del__(self):
+        # Best effort for callers that never call close()
+        try:
+            self.flush()
+        except Exception:
+            pass
+    
+    def upsert_many(
+        self,
+        records: list[dict[str, Any]],
+        batch_size: int = 64,
+        document_chunk_size: int = 1000
+    ) -> list[str]:
+        """
+        Store many vision analyses using batched embedding and parallel upserts.
+        
+        Records are embedded `document_chunk_size` at a time; each chunk is
+        sent as `batch_size`-vector upserts issued concurrently on the index
+        thread pool.
+        
+        Args:
+            records: One dict of `upsert_analysis` keyword arguments per frame
+            batch_size: Vectors per upsert request
+            document_chunk_size: Records embedded per encode pass
+            
+        Returns:
+            Unique IDs of the stored records, in input order
+        """
+        # Send buffered single upserts first so writes land in call order
+        self.flush()
+        
+        record_ids = []
+        
+        for start in range(0, len(records), document_chunk_size):
+            chunk = records[start:start + document_chunk_size]
+            
+            texts = [self._create_searchable_text(record["analysis"]) for record in chunk]
+            embeddings = self._create_embeddings(texts)
+            
+            vectors = [
+                self._build_vector(searchable_text=text, embedding=embedding, **record)
+                for record, text, embedding in zip(chunk, texts, embeddings)
+            ]
+            
+            async_results = [
+                self.index.upsert(vectors=vectors[i:i + batch_size], async_req=True)
+                for i in range(0, len(vectors), batch_size)
+            ]
+            for async_result in async_results:
+                async_result.get()
+            self._mirror_vectors(vectors)
+            
+            record_ids.extend(vector["id"] for vector in vectors)
+        
+        logger.info(f"Upserted {len(record_ids)} analyses")
+        
+        return record_ids
     
     def query_by_time_range(
         self,
@@ -195,31 +572,23 @@ class TemporalVectorStore:
             top_k: Maximum number of results
             
         Returns:
-            List of matching insights with metadata
+            List of matching insights with metadata, sorted by timestamp
         """
-        # Query with filters
-        results = self.index.query(
-            vector=[0] * self.dimension,  # Dummy vector for metadata-only query
-            filter={
-                "camera_id": {"$eq": camera_id},
-                "timestamp": {"$gte": start_time, "$lte": end_time}
-            },
-            top_k=top_k,
-            include_metadata=True
-        )
-        
-        # Format results
-        insights = []
-        for match in results['matches']:
-            insight = {
-                "id": match['id'],
-                "score": match['score'],
-                **match['metadata']
-            }
-            insights.append(insight)
-        
-        # Sort by timestamp
-        insights.sort(key=lambda x: x.get('timestamp', 0))
+        if self._mirror_synced:
+            insights = self._query_metadata(
+                "camera_id = ? AND timestamp BETWEEN ? AND ?",
+                (camera_id, start_time, end_time),
+                top_k
+            )
+        else:
+            self.flush()
+            insights = self._query_pinecone_metadata(
+                {
+                    "camera_id": {"$eq": camera_id},
+                    "timestamp": {"$gte": start_time, "$lte": end_time}
+                },
+                top_k
+            )
         
         logger.info(
             f"Found {len(insights)} insights for camera {camera_id} "
@@ -228,6 +597,42 @@ class TemporalVectorStore:
         
         return insights
     
+    def iter_by_camera(
+        self,
+        camera_id: int,
+        page_size: int = 50
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream all insights for a camera in chronological order, page by page.
+        
+        Args:
+            camera_id: Camera identifier
+            page_size: Maximum rows fetched per query
+            
+        Yields:
+            Insights with metadata, oldest first (at most PINECONE_MAX_TOP_K
+            when the mirror is incomplete, since Pinecone has no ordered scan)
+        """
+        if not self._mirror_synced:
+            self.flush()
+            yield from self._query_pinecone_metadata(
+                {"camera_id": {"$eq": camera_id}}, PINECONE_MAX_TOP_K
+            )
+            return
+        
+        last_key = (float("-inf"), "")
+        while True:
+            page = self._query_metadata(
+                "camera_id = ? AND (timestamp, id) > (?, ?)",
+                (camera_id, *last_key),
+                page_size
+            )
+            yield from page
+            
+            if len(page) < page_size:
+                break
+            last_key = (page[-1]["timestamp"], page[-1]["id"])
+    
     def query_by_semantic_search(
         self,
         query_text: str,
@@ -249,6 +654,8 @@ class TemporalVectorStore:
         Returns:
             List of most relevant insights
         """
+        self.flush()
+        
         # Generate query embedding
         query_embedding = self._create_embedding(query_text)
         
@@ -276,7 +683,7 @@ class TemporalVectorStore:
                 "relevance_score": match['score'],
                 **match['metadata']
             }
-            insights.append(insight)
+            insights.append(_format_insight(insight))
         
         logger.info(f"Semantic search found {len(insights)} relevant insights")
         
@@ -299,41 +706,91 @@ class TemporalVectorStore:
         Returns:
             List of matching insights
         """
-        filter_dict = {"threat_level": {"$eq": threat_level}}
-        
-        if camera_id is not None:
-            filter_dict["camera_id"] = {"$eq": camera_id}
+        if not self._mirror_synced:
+            self.flush()
+            filter_dict = {"threat_level": {"$eq": threat_level}}
+            if camera_id is not None:
+                filter_dict["camera_id"] = {"$eq": camera_id}
+            insights = self._query_pinecone_metadata(filter_dict, limit)
+        else:
+            where = "threat_level = ?"
+            params = (threat_level,)
+            
+            if camera_id is not None:
+                where += " AND camera_id = ?"
+                params += (camera_id,)
+            
+            insights = self._query_metadata(where, params, limit)
         
-        results = self.index.query(
-            vector=[0] * self.dimension,
-            filter=filter_dict,
-            top_k=limit,
-            include_metadata=True
+        logger.info(
+            f"Found {len(insights)} insights with threat level: {threat_level}"
         )
         
-        insights = []
-        for match in results['matches']:
-            insight = {
-                "id": match['id'],
-                **match['metadata']
-            }
-            insights.append(insight)
+        return insights
+    
+    def query_by_ingestion_time(
+        self,
+        start: float,
+        end: float,
+        camera_id: Optional[int] = None,
+        limit: int = 20
+    ) -> list[dict[str, Any]]:
+        """
+        Query insights stored between two wall-clock times.
         
-        insights.sort(key=lambda x: x.get('timestamp', 0))
+        Legacy records with an ISO-string ingestion_time are matched too.
+        Pinecone range filters only compare numbers, so when the mirror is
+        incomplete the range is applied after a camera-filtered query.
         
-        logger.info(
-            f"Found {len(insights)} insights with threat level: {threat_level}"
-        )
+        Args:
+            start: Earliest ingestion time, in epoch seconds
+            end: Latest ingestion time, in epoch seconds
+            camera_id: Optional camera filter
+            limit: Maximum number of results
+            
+        Returns:
+            List of matching insights, sorted by timestamp
+        """
+        if self._mirror_synced:
+            where = (
+                "ingestion_epoch(json_extract(metadata, '$.ingestion_time')) "
+                "BETWEEN ? AND ?"
+            )
+            params = (start, end)
+            
+            if camera_id is not None:
+                where += " AND camera_id = ?"
+                params += (camera_id,)
+            
+            insights = self._query_metadata(where, params, limit)
+        else:
+            self.flush()
+            filter_dict = {}
+            if camera_id is not None:
+                filter_dict["camera_id"] = {"$eq": camera_id}
+            candidates = self._query_pinecone_metadata(filter_dict, PINECONE_MAX_TOP_K)
+            insights = [
+                insight
+                for insight in candidates
+                if (ingested := _ingestion_epoch(insight.get("ingestion_time"))) is not None
+                and start <= ingested <= end
+            ][:limit]
+        
+        logger.info(f"Found {len(insights)} insights ingested in the requested window")
         
         return insights
     
     def delete_by_session(self, session_id: str):
         """Delete all insights for a specific session."""
+        self.flush()
         self.index.delete(filter={"session_id": {"$eq": session_id}})
+        with self.meta_db:
+            self.meta_db.execute("DELETE FROM insights WHERE session_id = ?", (session_id,))
         logger.info(f"Deleted insights for session: {session_id}")
     
     def get_stats(self) -> dict[str, Any]:
         """Get statistics about stored data."""
+        self.flush()
         stats = self.index.describe_index_stats()
         return {
             "total_vectors": stats['total_vector_count'],
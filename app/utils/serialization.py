@@ -0,0 +1,23 @@
+"""Compact JSON encoding, using orjson when it is installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def compact_json_bytes(data: Any) -> bytes:
+    """Encode data as JSON without whitespace, as UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def compact_json(data: Any) -> str:
+    """Encode data as JSON without whitespace; in prompts indentation only costs tokens."""
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, separators=(",", ":"))
@@ -1,6 +1,5 @@
 """Enhanced video frame extraction with scenario-based simulation."""
 
-import base64
 import logging
 from pathlib import Path
 from typing import Iterator
@@ -46,6 +45,11 @@ class EnhancedCameraFrameExtractor:
         }
     }
     
+    # Fonts and encoded scenario frames are shared by every extractor
+    _FONT = None
+    _FONT_SMALL = None
+    _SCENARIO_JPEGS: dict[tuple[int, str], bytes] = {}
+    
     def __init__(
         self,
         camera_id: int,
@@ -57,12 +61,33 @@ class EnhancedCameraFrameExtractor:
         self.video_path = Path(video_path) if video_path else None
         self.frame_count = 0
         
+        # Simulated frames have no per-frame content, so each camera and
+        # scenario is drawn and JPEG-encoded once
+        key = (camera_id, scenario)
+        if key not in self._SCENARIO_JPEGS:
+            buffer = io.BytesIO()
+            self._render_scenario().save(buffer, format='JPEG', quality=85)
+            self._SCENARIO_JPEGS[key] = buffer.getvalue()
+        self._scenario_jpeg = self._SCENARIO_JPEGS[key]
+        
         logger.info(
             f"Camera {camera_id}: Initialized with scenario '{scenario}'"
         )
     
-    def generate_simulated_frame(self, timestamp: float) -> CameraFrame:
-        """Generate a simulated frame with scenario-specific annotations."""
+    @classmethod
+    def _load_fonts(cls):
+        """Load overlay fonts once per process."""
+        if cls._FONT is None:
+            try:
+                cls._FONT = ImageFont.truetype("arial.ttf", 20)
+                cls._FONT_SMALL = ImageFont.truetype("arial.ttf", 14)
+            except:
+                cls._FONT = ImageFont.load_default()
+                cls._FONT_SMALL = ImageFont.load_default()
+        return cls._FONT, cls._FONT_SMALL
+    
+    def _render_scenario(self) -> Image.Image:
+        """Draw the scenario-specific frame for this camera."""
         
         scenario_data = self.SCENARIOS.get(self.scenario, self.SCENARIOS["normal"])
         
@@ -71,12 +96,7 @@ class EnhancedCameraFrameExtractor:
         draw = ImageDraw.Draw(img)
         
         # Add scenario information as text overlay
-        try:
-            font = ImageFont.truetype("arial.ttf", 20)
-            font_small = ImageFont.truetype("arial.ttf", 14)
-        except:
-            font = ImageFont.load_default()
-            font_small = ImageFont.load_default()
+        font, font_small = self._load_fonts()
         
         # Header
         draw.rectangle([(0, 0), (640, 50)], fill=(50, 50, 60))
@@ -115,20 +135,18 @@ class EnhancedCameraFrameExtractor:
         desc_text = scenario_data["description"]
         draw.text((10, 440), desc_text[:60], fill=(200, 200, 200), font=font_small)
         
-        # Convert to base64
-        img_byte_arr = io.BytesIO()
-        img.save(img_byte_arr, format='JPEG', quality=85)
-        img_byte_arr.seek(0)
-        image_bytes = img_byte_arr.getvalue()
-        image_base64 = base64.b64encode(image_bytes).decode('utf-8')
+        return img
+    
+    def generate_simulated_frame(self, timestamp: float) -> CameraFrame:
+        """Generate a simulated frame with scenario-specific annotations."""
         
         self.frame_count += 1
         
-        return CameraFrame(
+        return CameraFrame.model_construct(
             camera_id=self.camera_id,
             timestamp=timestamp,
             frame_number=self.frame_count,
-            image_base64=image_base64
+            image_bytes=self._scenario_jpeg
         )
     
     def extract_frames(self, num_frames: int = 1) -> Iterator[CameraFrame]:
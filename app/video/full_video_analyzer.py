@@ -2,9 +2,11 @@
 
 import asyncio
 import logging
-from typing import Any
+from collections import Counter
+from typing import Any, Optional
 from pathlib import Path
 
+from app.sensors.models import THREAT_ORDER, THREAT_RANK
 from app.video.real_video_processor import RealVideoProcessor
 from app.video.vision_analyzer import analyze_frame
 
@@ -14,7 +16,10 @@ logger = logging.getLogger(__name__)
 async def analyze_full_video(
     video_path: str,
     camera_id: int,
-    scenario: str = "unknown"
+    scenario: str = "unknown",
+    batch_size: Optional[int] = 16,
+    concurrency: int = 8,
+    dedup_threshold: int = 5
 ) -> dict[str, Any]:
     """
     Analyze all frames from a video at 5-second intervals.
@@ -23,6 +28,10 @@ async def analyze_full_video(
         video_path: Path to video file
         camera_id: Camera identifier
         scenario: Scenario context
+        batch_size: Frames decoded ahead of analysis (None = unbounded)
+        concurrency: Number of vision workers (requests in flight at once)
+        dedup_threshold: Frames whose dHash differs from the last analyzed
+            frame in fewer bits than this reuse its analysis (0 = disabled)
         
     Returns:
         Comprehensive analysis with temporal data
@@ -30,75 +39,166 @@ async def analyze_full_video(
     video_path = str(Path(video_path))
     logger.info(f"Analyzing full video: {video_path}")
     
-    frame_analyses = []
-    max_threat_level = "none"
-    threat_levels = {"none": 0, "low": 1, "medium": 2, "high": 3, "critical": 4}
+    max_rank = 0
     
-    with RealVideoProcessor(video_path, camera_id, fps_extract=0.2) as processor:
-        # Extract all frames at 5-second intervals
-        frames = list(processor.extract_frames())
-        logger.info(f"Extracted {len(frames)} frames from video")
+    total_frames = 0
+    video_duration = 0.0
+    skipped_frames = 0
+    last_hash = None
+    
+    # Frames stream from a decoder task through a bounded queue to vision
+    # workers, so only a few JPEGs are held in memory at any time
+    queue: asyncio.Queue = asyncio.Queue(maxsize=batch_size or 0)
+    results: dict[int, dict[str, Any]] = {}
+    duplicates: list[tuple[int, int, float]] = []
+    
+    async def next_frame(frames_iter):
+        # Decode off the event loop so it overlaps in-flight vision calls.
+        # The decode thread can't be cancelled, so on cancellation wait for
+        # it before the processor (and its capture) is released.
+        read = asyncio.ensure_future(asyncio.to_thread(next, frames_iter, None))
+        try:
+            return await asyncio.shield(read)
+        except asyncio.CancelledError:
+            await asyncio.wait({read})
+            raise
+    
+    async def produce(processor: RealVideoProcessor):
+        nonlocal total_frames, video_duration, skipped_frames, last_hash
+        frames_iter = processor.extract_frames()
         
-        # Analyze each frame
-        for i, frame in enumerate(frames, 1):
-            logger.info(f"Analyzing frame {i}/{len(frames)} at {frame.timestamp:.1f}s")
+        while (frame := await next_frame(frames_iter)) is not None:
+            total_frames += 1
+            video_duration = frame.timestamp
+            
+            # Only send frames that differ visibly from the last analyzed one
+            if (
+                last_hash is not None
+                and frame.dhash is not None
+                and (frame.dhash ^ last_hash).bit_count() < dedup_threshold
+            ):
+                skipped_frames += 1
+                duplicates.append((total_frames, frame.frame_number, frame.timestamp))
+                continue
+            last_hash = frame.dhash
             
-            analysis = await analyze_frame(
-                camera_id=camera_id,
-                image_base64=frame.image_base64,
-                scenario=scenario
+            await queue.put((total_frames, frame))
+        
+        for _ in range(concurrency):
+            await queue.put(None)
+    
+    async def worker():
+        while (item := await queue.get()) is not None:
+            index, frame = item
+            logger.info(
+                f"Analyzing frame {index}/{expected_frames} at {frame.timestamp:.1f}s"
             )
+            # One failed request (e.g. a 429) must not cancel the other
+            # workers, so it becomes an error result for this frame only
+            try:
+                analysis = await analyze_frame(
+                    camera_id=camera_id,
+                    image_bytes=frame.image_bytes,
+                    scenario=scenario
+                )
+            except Exception as e:
+                logger.error(f"Frame {index} analysis failed: {e}")
+                analysis = {
+                    "camera_id": camera_id,
+                    "status": "error",
+                    "error": str(e),
+                    "threat_level": "none"
+                }
             
             # Add temporal info
             analysis["frame_number"] = frame.frame_number
             analysis["timestamp"] = frame.timestamp
-            frame_analyses.append(analysis)
-            
-            # Track max threat
-            threat_level = analysis.get('threat_level', 'none')
-            if threat_levels.get(threat_level, 0) > threat_levels.get(max_threat_level, 0):
-                max_threat_level = threat_level
+            results[index] = analysis
     
-    # Aggregate analysis across all frames
-    weapons_detected = [
-        {"timestamp": a["timestamp"], "type": a.get("weapon_type")}
-        for a in frame_analyses 
-        if a.get("weapon_type") != "none"
-    ]
+    with RealVideoProcessor(video_path, camera_id, fps_extract=0.2) as processor:
+        # Extract frames at 5-second intervals
+        expected_frames = -(-processor.frame_count // processor.frame_interval)
+        
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(produce(processor))
+                for _ in range(concurrency):
+                    tg.create_task(worker())
+        except ExceptionGroup as eg:
+            # Surface the underlying error (e.g. a decode failure) rather
+            # than "unhandled errors in a TaskGroup"
+            raise eg.exceptions[0] from eg
     
-    unfamiliar_faces_count = sum(
-        1 for a in frame_analyses if a.get("unfamiliar_face")
-    )
+    # Near-identical scenes reuse the preceding frame's analysis
+    for index, frame_number, timestamp in duplicates:
+        results[index] = {
+            **results[index - 1],
+            "frame_number": frame_number,
+            "timestamp": timestamp
+        }
+    frame_analyses = [results[index] for index in range(1, total_frames + 1)]
     
-    all_threats = set()
+    # Aggregate analysis across all frames in a single pass
+    weapons_detected = []
+    failed_frames = 0
+    unfamiliar_faces_count = 0
+    threat_histogram = Counter()
+    max_people = 0
     for analysis in frame_analyses:
-        all_threats.update(analysis.get("threats_detected", []))
+        if analysis.get("error"):
+            failed_frames += 1
+        
+        rank = THREAT_RANK.get(analysis.get('threat_level', 'none'), 0)
+        if rank > max_rank:
+            max_rank = rank
+        
+        weapon_type = analysis.get("weapon_type")
+        if weapon_type and weapon_type != "none":
+            weapons_detected.append(
+                {"timestamp": analysis["timestamp"], "type": weapon_type}
+            )
+        
+        if analysis.get("unfamiliar_face"):
+            unfamiliar_faces_count += 1
+        
+        threat_histogram.update(analysis.get("threats_detected") or ())
+        
+        people = analysis.get("people_count", 0)
+        if people > max_people:
+            max_people = people
+    
+    max_threat_level = THREAT_ORDER[max_rank]
+    all_threats = list(threat_histogram)
     
     # Build comprehensive result
     result = {
         "camera_id": camera_id,
         "video_path": video_path,
         "scenario": scenario,
-        "total_frames_analyzed": len(frames),
-        "video_duration": frames[-1].timestamp if frames else 0,
+        "total_frames_analyzed": total_frames,
+        "duplicate_frames_skipped": skipped_frames,
+        "failed_frames": failed_frames,
+        "video_duration": video_duration,
         "max_threat_level": max_threat_level,
         "weapons_detected": weapons_detected,
         "unfamiliar_faces_detected": unfamiliar_faces_count > 0,
         "unfamiliar_faces_count": unfamiliar_faces_count,
-        "all_threats": list(all_threats),
+        "all_threats": all_threats,
+        "threat_histogram": dict(threat_histogram),
         "frame_analyses": frame_analyses,
         # Summary for orchestrator
         "threat_level": max_threat_level,
         "weapon_type": weapons_detected[0]["type"] if weapons_detected else "none",
         "unfamiliar_face": unfamiliar_faces_count > 0,
-        "people_count": max(a.get("people_count", 0) for a in frame_analyses) if frame_analyses else 0,
-        "threats_detected": list(all_threats),
-        "description": f"Video analysis: {len(frames)} frames over {frames[-1].timestamp:.1f}s. Max threat: {max_threat_level}."
+        "people_count": max_people,
+        "threats_detected": all_threats,
+        "description": f"Video analysis: {total_frames} frames over {video_duration:.1f}s. Max threat: {max_threat_level}."
     }
     
     logger.info(
         f"Video analysis complete: {max_threat_level.upper()} threat level, "
-        f"{len(weapons_detected)} weapon detections"
+        f"{len(weapons_detected)} weapon detections, "
+        f"{skipped_frames} duplicate frames skipped"
     )
     
     return result
\ No newline at end of file
@@ -1,26 +1,38 @@
 """Real video processing for threat detection."""
 
-import base64
 import logging
+from itertools import count
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, Literal, Optional
 import cv2
-from PIL import Image
-import io
+import numpy as np
 
 from ..sensors.models import CameraFrame
 
+try:
+    from turbojpeg import TJPF_BGR, TurboJPEG
+    _turbojpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):  # PyTurboJPEG or libturbojpeg missing
+    _turbojpeg = None
+
 logger = logging.getLogger(__name__)
 
+JPEG_QUALITY = 85
+
 
 class RealVideoProcessor:
     """Processes real video files for threat detection."""
     
+    # Forward gaps up to this many frames are grabbed rather than seeked
+    MAX_GRAB_SKIP = 30
+    
     def __init__(
         self,
         video_path: str,
         camera_id: int,
-        fps_extract: float = 0.2  # Extract 1 frame every 5 seconds
+        fps_extract: float = 0.2,  # Extract 1 frame every 5 seconds
+        backend: Literal["opencv", "pyav"] = "opencv",
+        hwaccel: Optional[str] = "cuda"
     ):
         """
         Initialize video processor.
@@ -29,53 +41,85 @@ class RealVideoProcessor:
             video_path: Path to the video file
             camera_id: Camera identifier
             fps_extract: Frames to extract per second (0.2 = 1 frame per 5 seconds)
+            backend: "opencv" (software decode) or "pyav" (FFmpeg via PyAV)
+            hwaccel: PyAV hardware decoder device ("cuda", "qsv",
+                "videotoolbox", ...); falls back to software if unavailable
         """
         self.video_path = Path(video_path)
         self.camera_id = camera_id
         self.fps_extract = fps_extract
+        self.backend = backend
+        self.cap = None
+        self.container = None
         
         if not self.video_path.exists():
             raise FileNotFoundError(f"Video file not found: {video_path}")
         
-        self.cap = cv2.VideoCapture(str(self.video_path))
-        if not self.cap.isOpened():
-            raise ValueError(f"Cannot open video: {video_path}")
-        
         # Get video properties
-        self.fps = self.cap.get(cv2.CAP_PROP_FPS)
-        self.frame_count = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        if backend == "pyav":
+            self.fps, self.frame_count = self._open_pyav(hwaccel)
+        else:
+            self.cap = cv2.VideoCapture(str(self.video_path))
+            if not self.cap.isOpened():
+                raise ValueError(f"Cannot open video: {video_path}")
+            
+            self.fps = self.cap.get(cv2.CAP_PROP_FPS)
+            self.frame_count = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
         self.duration = self.frame_count / self.fps if self.fps > 0 else 0
         self.frame_interval = int(self.fps / self.fps_extract) if self.fps > 0 else 1
         
         logger.info(
             f"Camera {camera_id}: Loaded {self.video_path.name} "
             f"(FPS: {self.fps:.2f}, Duration: {self.duration:.2f}s, "
-            f"Total Frames: {self.frame_count})"
+            f"Total Frames: {self.frame_count}, Backend: {backend})"
         )
     
-    def _frame_to_base64(self, frame) -> str:
-        """Convert OpenCV frame to base64 encoded JPEG."""
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    def _open_pyav(self, hwaccel: Optional[str]) -> tuple[float, int]:
+        """Open the video with PyAV, decoding on hardware when available."""
+        import av
+        from av.codec.hwaccel import HWAccel
+        
+        self.container = av.open(
+            str(self.video_path),
+            hwaccel=HWAccel(device_type=hwaccel, allow_software_fallback=True) if hwaccel else None
+        )
+        self.stream = self.container.streams.video[0]
         
-        # Convert to PIL Image
-        pil_image = Image.fromarray(rgb_frame)
+        fps = float(self.stream.average_rate or 0)
+        frame_count = self.stream.frames
+        if not frame_count and self.container.duration:
+            frame_count = int(self.container.duration / av.time_base * fps)
         
+        return fps, frame_count
+    
+    def _frame_to_jpeg(self, frame) -> bytes:
+        """Convert OpenCV frame to JPEG bytes."""
         # Resize if too large (optional, saves bandwidth)
         max_size = 1024
-        if max(pil_image.size) > max_size:
-            ratio = max_size / max(pil_image.size)
-            new_size = (int(pil_image.size[0] * ratio), int(pil_image.size[1] * ratio))
-            pil_image = pil_image.resize(new_size, Image.Resampling.LANCZOS)
+        height, width = frame.shape[:2]
+        if max(height, width) > max_size:
+            ratio = max_size / max(height, width)
+            new_size = (int(width * ratio), int(height * ratio))
+            frame = cv2.resize(frame, new_size, interpolation=cv2.INTER_AREA)
+        
+        # Encode BGR frame straight to JPEG (no RGB/PIL round-trip), through
+        # libjpeg-turbo's SIMD encoder directly when PyTurboJPEG is installed
+        if _turbojpeg is not None:
+            return _turbojpeg.encode(frame, quality=JPEG_QUALITY, pixel_format=TJPF_BGR)
         
-        # Convert to JPEG bytes
-        img_byte_arr = io.BytesIO()
-        pil_image.save(img_byte_arr, format='JPEG', quality=85)
-        img_byte_arr.seek(0)
-        image_bytes = img_byte_arr.getvalue()
+        ok, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+        if not ok:
+            raise ValueError(f"Camera {self.camera_id}: JPEG encoding failed")
         
-        # Encode to base64
-        return base64.b64encode(image_bytes).decode('utf-8')
+        return buffer.tobytes()
+    
+    @staticmethod
+    def _dhash(frame) -> int:
+        """Compute a 64-bit difference hash (dHash) of a BGR frame."""
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+        bits = small[:, 1:] > small[:, :-1]
+        return int.from_bytes(np.packbits(bits).tobytes(), 'big')
     
     def extract_frames(self, max_frames: int = None) -> Iterator[CameraFrame]:
         """
@@ -87,38 +131,156 @@ class RealVideoProcessor:
         Yields:
             CameraFrame objects with extracted frames
         """
-        frame_num = 0
         extracted = 0
         
-        while True:
-            ret, frame = self.cap.read()
-            if not ret:
+        # Bind loop-invariant attributes and methods once
+        camera_id = self.camera_id
+        seconds_per_frame = 1.0 / self.fps if self.fps > 0 else 0.0
+        to_jpeg = self._frame_to_jpeg
+        dhash = self._dhash
+        construct = CameraFrame.model_construct
+        
+        for frame_num, frame in self._sampled_frames():
+            extracted += 1
+            yield construct(
+                camera_id=camera_id,
+                timestamp=frame_num * seconds_per_frame,
+                frame_number=frame_num,
+                image_bytes=to_jpeg(frame),
+                dhash=dhash(frame)
+            )
+            
+            # Check if we've reached max frames
+            if max_frames and extracted >= max_frames:
                 logger.info(
-                    f"Camera {self.camera_id}: Extracted {extracted} frames from video"
+                    f"Camera {self.camera_id}: Reached max frames ({max_frames})"
                 )
                 break
+        
+        logger.info(
+            f"Camera {self.camera_id}: Extracted {extracted} frames from video"
+        )
+    
+    def extract_batch(self, batch_size: int = 8) -> Iterator[np.ndarray]:
+        """
+        Extract frames at the same interval as raw BGR arrays, stacked in batches.
+        
+        Skips JPEG encoding entirely, for local models (e.g. an on-box
+        pre-filter) that can run one inference call over a whole batch.
+        
+        Args:
+            batch_size: Frames per batch; the last batch may be smaller
             
-            # Extract frame at interval
-            if frame_num % self.frame_interval == 0:
-                timestamp = frame_num / self.fps if self.fps > 0 else 0
-                image_base64 = self._frame_to_base64(frame)
-                
-                extracted += 1
-                yield CameraFrame(
-                    camera_id=self.camera_id,
-                    timestamp=timestamp,
-                    frame_number=frame_num,
-                    image_base64=image_base64
-                )
-                
-                # Check if we've reached max frames
-                if max_frames and extracted >= max_frames:
-                    logger.info(
-                        f"Camera {self.camera_id}: Reached max frames ({max_frames})"
-                    )
-                    break
+        Yields:
+            Arrays of shape (batch, height, width, 3)
+        """
+        batch = []
+        for _, frame in self._sampled_frames():
+            batch.append(frame)
+            if len(batch) == batch_size:
+                yield np.stack(batch)
+                batch = []
+        
+        if batch:
+            yield np.stack(batch)
+    
+    def _sampled_frames(self) -> Iterator[tuple[int, np.ndarray]]:
+        """
+        Yield (frame_number, BGR frame) for every frame at the interval.
+        
+        Runs until the first failed seek or read rather than trusting the
+        reported frame count, which can be wrong (e.g. VFR files). Sources
+        that report no frame count or FPS (streams, some containers) are
+        read sequentially to EOF instead of seeked.
+        """
+        if self.frame_count <= 0 or self.fps <= 0:
+            yield from self._sequential_frames()
+            return
+        
+        # Jump straight to each frame at the interval instead of decoding
+        # (and discarding) every frame in between
+        read_frame = self._read_frame
+        for frame_num in count(0, self.frame_interval):
+            frame = read_frame(frame_num)
+            if frame is None:
+                return
+            yield frame_num, frame
+    
+    def _sequential_frames(self) -> Iterator[tuple[int, np.ndarray]]:
+        """Decode from the start to EOF, converting only frames at the interval."""
+        interval = self.frame_interval
+        
+        if self.backend == "pyav":
+            import av
             
-            frame_num += 1
+            try:
+                self.container.seek(0)
+            except av.error.FFmpegError:
+                pass  # Unseekable source; decode from where it is
+            for frame_num, frame in enumerate(self.container.decode(self.stream)):
+                if frame_num % interval == 0:
+                    yield frame_num, frame.to_ndarray(format='bgr24')
+            return
+        
+        if int(self.cap.get(cv2.CAP_PROP_POS_FRAMES)) != 0:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        for frame_num in count():
+            if frame_num % interval == 0:
+                ret, frame = self.cap.read()
+                if not ret:
+                    return
+                yield frame_num, frame
+            elif not self.cap.grab():
+                return
+    
+    def _read_frame(self, frame_number: int):
+        """Decode a single frame as a BGR array, or None past the end."""
+        if self.backend == "pyav":
+            return self._read_pyav_frame(frame_number)
+        
+        if not self._seek(frame_number):
+            return None
+        ret, frame = self.cap.read()
+        return frame if ret else None
+    
+    def _read_pyav_frame(self, frame_number: int):
+        """Seek to the keyframe before `frame_number` and decode up to it."""
+        import av
+        
+        seconds = frame_number / self.fps if self.fps > 0 else 0
+        target_pts = int(seconds / self.stream.time_base) + (self.stream.start_time or 0)
+        
+        try:
+            self.container.seek(target_pts, stream=self.stream, any_frame=False, backward=True)
+        except av.error.FFmpegError as e:
+            logger.warning(f"Camera {self.camera_id}: Seek to frame {frame_number} failed: {e}")
+            return None
+        for frame in self.container.decode(self.stream):
+            if frame.pts is not None and frame.pts >= target_pts:
+                return frame.to_ndarray(format='bgr24')
+        return None
+    
+    def _seek(self, frame_number: int) -> bool:
+        """
+        Position the capture so the next read returns `frame_number`.
+        
+        Returns False when the seek fails or the source ends first.
+        
+        Short forward gaps are skipped with grab(), which avoids the
+        YUV->BGR conversion of read(); a real seek re-decodes from the
+        preceding keyframe and is only worth it for longer jumps. Some
+        codecs land on that keyframe, so any gap left after a seek is
+        grabbed too.
+        """
+        position = int(self.cap.get(cv2.CAP_PROP_POS_FRAMES))
+        if not 0 <= frame_number - position <= self.MAX_GRAB_SKIP:
+            if not self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number):
+                logger.warning(f"Camera {self.camera_id}: Seek to frame {frame_number} failed")
+                return False
+            position = int(self.cap.get(cv2.CAP_PROP_POS_FRAMES))
+        while position < frame_number and self.cap.grab():
+            position += 1
+        return position == frame_number
     
     def extract_single_frame(self, frame_number: int = 0) -> CameraFrame:
         """
@@ -130,21 +292,18 @@ class RealVideoProcessor:
         Returns:
             CameraFrame object
         """
-        # Set frame position
-        self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-        
-        ret, frame = self.cap.read()
-        if not ret:
+        frame = self._read_frame(frame_number)
+        if frame is None:
             raise ValueError(f"Cannot read frame {frame_number}")
         
-        timestamp = frame_number / self.fps if self.fps > 0 else 0
-        image_base64 = self._frame_to_base64(frame)
+        timestamp = frame_number / self.fps if self.fps > 0 else 0.0
+        image_bytes = self._frame_to_jpeg(frame)
         
-        return CameraFrame(
+        return CameraFrame.model_construct(
             camera_id=self.camera_id,
             timestamp=timestamp,
             frame_number=frame_number,
-            image_base64=image_base64
+            image_bytes=image_bytes
         )
     
     def release(self):
@@ -152,6 +311,9 @@ class RealVideoProcessor:
         if self.cap:
             self.cap.release()
             logger.info(f"Camera {self.camera_id}: Released video capture")
+        if self.container:
+            self.container.close()
+            logger.info(f"Camera {self.camera_id}: Closed video container")
     
     def __enter__(self):
         return self
@@ -1,16 +1,33 @@
 """Vision analysis using Google ADK agents."""
 
 from typing import Any
+from uuid import uuid4
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
 
 from ..agents.vision_agent import create_vision_agent
 
+# Agent, session service and runner are built once and shared by all calls
+_SESSION_SERVICE = InMemorySessionService()
+_RUNNER = None
+
+
+def _get_runner() -> Runner:
+    """Return the shared vision runner, creating it on first use."""
+    global _RUNNER
+    if _RUNNER is None:
+        _RUNNER = Runner(
+            agent=create_vision_agent(),
+            app_name="threat_detection",
+            session_service=_SESSION_SERVICE
+        )
+    return _RUNNER
+
 
 async def analyze_frame(
     camera_id: int,
-    image_base64: str,
+    image_bytes: bytes,
     scenario: str = "normal"
 ) -> dict[str, Any]:
     """
@@ -18,28 +35,22 @@ async def analyze_frame(
     
     Args:
         camera_id: Camera identifier
-        image_base64: Base64 encoded image
+        image_bytes: JPEG encoded image
         scenario: The scenario context for better analysis
         
     Returns:
         Dictionary containing vision analysis results
     """
-    vision_agent = create_vision_agent()
+    runner = _get_runner()
     
-    session_id = f"camera_{camera_id}_vision"
-    session_service = InMemorySessionService()
-    await session_service.create_session(
+    # Unique session per call keeps concurrent frames isolated
+    session_id = f"camera_{camera_id}_{uuid4().hex}"
+    await _SESSION_SERVICE.create_session(
         app_name="threat_detection",
         user_id="system",
         session_id=session_id
     )
     
-    runner = Runner(
-        agent=vision_agent,
-        app_name="threat_detection",
-        session_service=session_service
-    )
-    
     # Create multimodal content with image
     content = types.Content(
         role="user",
@@ -48,28 +59,28 @@ async def analyze_frame(
             types.Part(
                 inline_data=types.Blob(
                     mime_type="image/jpeg",
-                    data=image_base64
+                    data=image_bytes
                 )
             )
         ]
     )
     
-    # Run analysis
-    async for event in runner.run_async(
-        user_id="system",
-        session_id=session_id,
-        new_message=content
-    ):
-        pass  # Process events
-    
-    # Retrieve analysis from session state
-    session = await session_service.get_session(
-        user_id="system",
-        session_id=session_id,
-        app_name="threat_detection"
-    )
-    
-    analysis = session.state.get("vision_analysis", {})
+    # Run analysis; the final response event carries the output_key value
+    analysis = {}
+    try:
+        async for event in runner.run_async(
+            user_id="system",
+            session_id=session_id,
+            new_message=content
+        ):
+            analysis = event.actions.state_delta.get("vision_analysis", analysis)
+    finally:
+        # The session holds the frame's JPEG; drop it even when the call fails
+        await _SESSION_SERVICE.delete_session(
+            user_id="system",
+            session_id=session_id,
+            app_name="threat_detection"
+        )
     
     # Add camera metadata
     analysis["camera_id"] = camera_id
@@ -0,0 +1,51 @@
+"""Unit tests for the pipeline's orchestrator model routing."""
+
+import pytest
+
+pytest.importorskip("google.adk")
+pytest.importorskip("cv2")
+pytest.importorskip("numpy")
+
+from app.pipeline import is_low_stakes  # noqa: E402
+from app.sensors.triage import GRAY_ZONE, MEDIUM, NONE  # noqa: E402
+
+CLEAR_CAMERAS = [
+    {"camera_id": 1, "threat_level": "none"},
+    {"camera_id": 2, "threat_level": "none"},
+]
+
+
+def test_benign_signals_use_lite_model() -> None:
+    """Clear cameras, gray-zone readings and a low sensor verdict are low stakes."""
+    assert is_low_stakes(CLEAR_CAMERAS, {"threat_level": "low"}, GRAY_ZONE)
+    assert is_low_stakes(CLEAR_CAMERAS, {"threat_level": "none"}, NONE)
+
+
+@pytest.mark.parametrize("sensor_level", ["medium", "high", "critical"])
+def test_sensor_agent_verdict_overrides_gray_zone(sensor_level: str) -> None:
+    """A gray-zone batch the sensor agent rates serious goes to the full model."""
+    assert not is_low_stakes(CLEAR_CAMERAS, {"threat_level": sensor_level}, GRAY_ZONE)
+
+
+def test_sensor_error_or_missing_verdict_uses_full_model() -> None:
+    """Without a usable sensor verdict the decision is not low stakes."""
+    assert not is_low_stakes(
+        CLEAR_CAMERAS, {"threat_level": "none", "error": "timeout"}, GRAY_ZONE
+    )
+    assert not is_low_stakes(CLEAR_CAMERAS, {}, GRAY_ZONE)
+
+
+def test_alerting_triage_uses_full_model() -> None:
+    """Readings past an alert threshold always go to the full model."""
+    assert not is_low_stakes(CLEAR_CAMERAS, {"threat_level": "low"}, MEDIUM)
+
+
+def test_camera_threat_or_failure_uses_full_model() -> None:
+    """Any camera threat or offline camera goes to the full model."""
+    threat = [*CLEAR_CAMERAS, {"camera_id": 3, "threat_level": "medium"}]
+    offline = [
+        *CLEAR_CAMERAS,
+        {"camera_id": 3, "error": "timeout", "status": "offline"},
+    ]
+    assert not is_low_stakes(threat, {"threat_level": "none"}, NONE)
+    assert not is_low_stakes(offline, {"threat_level": "none"}, NONE)
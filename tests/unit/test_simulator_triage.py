@@ -0,0 +1,33 @@
+"""Unit tests for triage of simulated sensor scenarios."""
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pydantic")
+
+from app.sensors.simulator import SensorSimulator  # noqa: E402
+from app.sensors.triage import (  # noqa: E402
+    CRITICAL,
+    GRAY_ZONE,
+    NONE,
+    triage_sensor_data,
+)
+
+
+@pytest.mark.parametrize(
+    ("scenario", "minimum", "maximum"),
+    [
+        ("normal", NONE, NONE),
+        ("fire", CRITICAL, CRITICAL),
+        ("fall", GRAY_ZONE, CRITICAL),
+        ("intrusion", GRAY_ZONE, CRITICAL),
+    ],
+)
+def test_simulated_scenarios(scenario: str, minimum: int, maximum: int) -> None:
+    """
+    Simulated normal readings take the fast path; fire is always critical,
+    and fall and intrusion readings always go to the LLM.
+    """
+    simulator = SensorSimulator(scenario=scenario)
+    levels = {triage_sensor_data(simulator.generate_batch()) for _ in range(500)}
+    assert minimum <= min(levels) and max(levels) <= maximum
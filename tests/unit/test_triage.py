@@ -0,0 +1,131 @@
+"""Unit tests for the deterministic sensor triage gate."""
+
+import pytest
+
+from app.sensors.triage import (
+    AUDIO_CLASS_IDS,
+    CRITICAL,
+    GRAY_ZONE,
+    HIGH,
+    MEDIUM,
+    NONE,
+    triage,
+    triage_sensor_data,
+)
+
+# A clearly normal reading: heart rate, SpO2, magnitude, smoke, CO, audio, alarm
+NORMAL = {
+    "heart_rate": 70.0,
+    "oxygen": 97.0,
+    "magnitude": 9.8,
+    "smoke_ppm": 5.0,
+    "co_ppm": 2.0,
+    "audio_id": AUDIO_CLASS_IDS["silence"],
+    "alarm": False,
+}
+
+
+def _triage(**overrides) -> int:
+    return triage(**{**NORMAL, **overrides})
+
+
+def _sensor_data(
+    heart_rate: float = 70,
+    oxygen: float = 97.0,
+    magnitude: float = 9.8,
+    smoke_ppm: float = 5.0,
+    co_ppm: float = 2.0,
+    audio: str = "silence",
+    alarm: bool = False,
+) -> dict:
+    """Build a SensorSimulator.generate_batch()-shaped dict."""
+    return {
+        "accelerometer": {"magnitude": magnitude},
+        "heart_rate": {"heart_rate": heart_rate, "oxygen_saturation": oxygen},
+        "audio": {"event_classification": audio},
+        "smoke_detector": {
+            "smoke_level_ppm": smoke_ppm,
+            "co_level_ppm": co_ppm,
+            "alarm_triggered": alarm,
+        },
+    }
+
+
+def test_normal_reading_is_none() -> None:
+    """A reading well inside every band needs no LLM analysis."""
+    assert _triage() == NONE
+
+
+@pytest.mark.parametrize(
+    ("overrides", "expected"),
+    [
+        # Oxygen: critical below 90, gray below 94
+        ({"oxygen": 89.9}, CRITICAL),
+        ({"oxygen": 90.0}, GRAY_ZONE),
+        ({"oxygen": 93.9}, GRAY_ZONE),
+        ({"oxygen": 94.0}, NONE),
+        # Smoke: critical above 100 ppm, gray above 50 ppm
+        ({"smoke_ppm": 100.1}, CRITICAL),
+        ({"smoke_ppm": 100.0}, GRAY_ZONE),
+        ({"smoke_ppm": 50.1}, GRAY_ZONE),
+        ({"smoke_ppm": 50.0}, NONE),
+        ({"alarm": True}, CRITICAL),
+        # Acceleration: a fall above 20 m/s², gray above 15 m/s²
+        ({"magnitude": 20.1}, HIGH),
+        ({"magnitude": 20.0}, GRAY_ZONE),
+        ({"magnitude": 15.1}, GRAY_ZONE),
+        ({"magnitude": 15.0}, NONE),
+        # Heart rate: alert outside 50-120, gray outside 55-110
+        ({"heart_rate": 49.0}, MEDIUM),
+        ({"heart_rate": 50.0}, GRAY_ZONE),
+        ({"heart_rate": 54.0}, GRAY_ZONE),
+        ({"heart_rate": 55.0}, NONE),
+        ({"heart_rate": 110.0}, NONE),
+        ({"heart_rate": 111.0}, GRAY_ZONE),
+        ({"heart_rate": 120.0}, GRAY_ZONE),
+        ({"heart_rate": 121.0}, MEDIUM),
+        # Carbon monoxide only ever makes a reading gray
+        ({"co_ppm": 35.0}, NONE),
+        ({"co_ppm": 35.1}, GRAY_ZONE),
+        # Audio: threats are medium, anything beyond speech is gray
+        ({"audio_id": AUDIO_CLASS_IDS["normal_speech"]}, NONE),
+        ({"audio_id": AUDIO_CLASS_IDS["loud_noise"]}, GRAY_ZONE),
+        ({"audio_id": AUDIO_CLASS_IDS["door_slam"]}, GRAY_ZONE),
+        ({"audio_id": AUDIO_CLASS_IDS["alarm"]}, GRAY_ZONE),
+        ({"audio_id": AUDIO_CLASS_IDS["scream"]}, MEDIUM),
+        ({"audio_id": AUDIO_CLASS_IDS["glass_breaking"]}, MEDIUM),
+    ],
+)
+def test_threshold_boundaries(overrides: dict, expected: int) -> None:
+    """Each threshold flips the level exactly at its boundary."""
+    assert _triage(**overrides) == expected
+
+
+def test_most_severe_condition_wins() -> None:
+    """A fall with critical oxygen is critical, not just high."""
+    assert _triage(magnitude=22.0, oxygen=88.0, heart_rate=45.0) == CRITICAL
+    assert _triage(magnitude=22.0, heart_rate=45.0) == HIGH
+    assert _triage(smoke_ppm=300.0, magnitude=22.0) == CRITICAL
+
+
+@pytest.mark.parametrize(
+    ("sensor_data", "expected"),
+    [
+        (_sensor_data(), NONE),
+        # Fire: smoke over threshold with the alarm sounding
+        (
+            _sensor_data(smoke_ppm=250.0, co_ppm=120.0, audio="alarm", alarm=True),
+            CRITICAL,
+        ),
+        # Fall: hard impact with dropping oxygen
+        (_sensor_data(magnitude=22.0, heart_rate=48, oxygen=88.0), CRITICAL),
+        (_sensor_data(magnitude=22.0, heart_rate=58, oxygen=93.0), HIGH),
+        (_sensor_data(heart_rate=135, audio="scream"), MEDIUM),
+        # Unknown audio classes are treated as threats
+        (_sensor_data(audio="gunshot"), MEDIUM),
+    ],
+)
+def test_triage_sensor_data(sensor_data: dict, expected: int) -> None:
+    """Batch dicts are unpacked into the kernel's inputs."""
+    assert triage_sensor_data(sensor_data) == expected
+